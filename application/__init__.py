@@ -1,32 +1,81 @@
+import atexit
 from flask import Flask
 from mongoengine import connect
+from application.config import load_config
 
 
 def register_blueprints(app: Flask):
     from application.views.user_views import user_blueprint as user_app
     from application.views.post_views import post_blueprint as post_app
     from application.views.tag_views import tag_blueprint as tag_app
+    from application.views.system_views import system_blueprint as system_app
+    from application.views.stats_views import stats_blueprint as stats_app
 
     app.register_blueprint(user_app)
     app.register_blueprint(post_app)
     app.register_blueprint(tag_app)
+    app.register_blueprint(system_app)
+    app.register_blueprint(stats_app)
+
+
+def register_commands(app: Flask):
+    from application.commands.index_commands import index_cli
+    from application.commands.comment_commands import comment_cli
+    from application.commands.tag_commands import tag_cli
+    from application.commands.stats_commands import stats_cli
+
+    app.cli.add_command(index_cli)
+    app.cli.add_command(comment_cli)
+    app.cli.add_command(tag_cli)
+    app.cli.add_command(stats_cli)
+
+
+def register_middleware(app: Flask):
+    from application.shared.compression import compress_response
+    from application.shared.metrics import start_timer, record_request
+    from application.shared.profiler import start_profiling, report_profile, stop_profiling
+
+    app.before_request(start_timer)
+    app.before_request(start_profiling)
+    # after_request hooks run in reverse order: record_request sees the compressed response
+    app.after_request(record_request)
+    app.after_request(compress_response)
+    app.after_request(report_profile)
+    app.teardown_request(stop_profiling)
 
 
 def create_db(app: Flask):
-    connect(
-        db=app.config['MONGODB_SETTINGS']['db'],
-        host=app.config['MONGODB_SETTINGS']['host'],
-        port=app.config['MONGODB_SETTINGS']['port']
+    from application.shared.monitoring import pool_stats, command_metrics
+    from application.shared.profiler import profiler
+
+    # every setting besides db, host and port is passed on to MongoClient
+    connect(**app.config['MONGODB_SETTINGS'], event_listeners=[pool_stats, command_metrics, profiler])
+
+
+def register_comment_queue(app: Flask):
+    if not app.config['COMMENT_QUEUE']:
+        return
+
+    from application.shared.comment_queue import CommentQueue
+
+    queue = CommentQueue(
+        app.config['COMMENT_QUEUE_SIZE'],
+        app.config['COMMENT_QUEUE_BATCH_SIZE'],
+        app.config['COMMENT_QUEUE_INTERVAL'],
+        app.config['COMMENT_QUEUE_PUT_TIMEOUT'],
+        app.config['COMMENT_WRITE_CONCERN']
     )
+    app.extensions['comment_queue'] = queue
+    atexit.register(queue.stop)
 
 
-def create_app() -> Flask:
+def create_app(config: dict = None) -> Flask:
     app: Flask = Flask(__name__)
-    app.config['MONGODB_SETTINGS'] = {
-        'db': 'tumblelog',
-        'host': 'localhost',
-        'port': 27017
-    }
+    app.config.update(load_config())
+    app.config.update(config or {})
     register_blueprints(app)
+    register_commands(app)
+    register_middleware(app)
     create_db(app)
+    register_comment_queue(app)
     return app
@@ -0,0 +1,38 @@
+from quart import Quart
+from application.aio import db
+from application.config import load_config
+
+
+def register_blueprints(app: Quart):
+    from application.aio.views.user_views import user_blueprint as user_app
+    from application.aio.views.post_views import post_blueprint as post_app
+    from application.aio.views.tag_views import tag_blueprint as tag_app
+
+    app.register_blueprint(user_app)
+    app.register_blueprint(post_app)
+    app.register_blueprint(tag_app)
+
+
+def create_db(app: Quart):
+    # the motor client has to be created on the event loop that serves the requests
+    @app.before_serving
+    async def connect():
+        db.connect(app.config['MONGODB_SETTINGS'])
+
+    @app.after_serving
+    async def disconnect():
+        db.disconnect()
+
+
+def create_app(config: dict = None) -> Quart:
+    """
+    The async variant of the app: the I/O-bound user, post and tag endpoints as async
+    views on Quart and motor, with the same collections, settings and serializers as the
+    Flask app, so that one worker serves many requests waiting on Mongo at once.
+    """
+    app: Quart = Quart(__name__)
+    app.config.update(load_config())
+    app.config.update(config or {})
+    register_blueprints(app)
+    create_db(app)
+    return app
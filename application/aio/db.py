@@ -0,0 +1,66 @@
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne
+
+_client = None
+_database = None
+
+
+def connect(settings: dict):
+    """
+    Connect the async app with the same MONGODB_SETTINGS as the Flask app: db, host and
+    port, every other setting being passed on to the client as for mongoengine's connect().
+    """
+    global _client, _database
+    options = {key: value for key, value in settings.items() if key not in ('db', 'host', 'port')}
+    _client = AsyncIOMotorClient(host=settings['host'], port=settings['port'], **options)
+    _database = _client[settings['db']]
+
+
+def disconnect():
+    global _client, _database
+    if _client is not None:
+        _client.close()
+    _client = _database = None
+
+
+def collection(document):
+    """
+    The motor collection of a mongoengine document class, under the same collection name.
+    """
+    return _database[document._get_collection_name()]
+
+
+def subclass_filter(document) -> dict:
+    """
+    The _cls filter mongoengine adds to the queries of an inheritable document class.
+    """
+    if not document._meta.get('allow_inheritance'):
+        return {}
+    if len(document._subclasses) == 1:
+        return {'_cls': document._subclasses[0]}
+    return {'_cls': {'$in': list(document._subclasses)}}
+
+
+async def bump(*names: str):
+    """
+    Async CollectionVersion.bump(), so that the response and author page caches of the
+    Flask app see the writes made through the async app.
+    """
+    from application.models.collection_version import CollectionVersion
+
+    if names:
+        await collection(CollectionVersion).bulk_write([
+            UpdateOne({'_id': name}, {'$inc': {'version': 1}}, upsert=True) for name in names
+        ], ordered=False)
+
+
+async def record_stats(post, posts: int = 0, comments: int = 0):
+    """
+    Async Stat.record(), so that the counters served by /stats include the writes made
+    through the async app.
+    """
+    from application.models.stat import Stat
+
+    requests = Stat.updates(*Stat.changes(post, posts, comments))
+    if requests:
+        await collection(Stat).bulk_write(requests, ordered=False)
@@ -0,0 +1,21 @@
+from application.shared.pagination import encode_cursor, decode_cursor, cursor_object_id, parse_limit
+
+
+async def paginate(collection, query: dict, args: dict, projection: dict = None):
+    """
+    Async counterpart of application.shared.pagination.paginate for motor collections:
+    one page of raw documents newest first, seeking on _id after args['after'].
+
+    Returns a tuple (documents, next_cursor); next_cursor is None on the last page.
+    """
+    limit = parse_limit(args.get('limit'))
+    after = args.get('after')
+    if after:
+        query = {**query, '_id': {'$lt': cursor_object_id(decode_cursor(after).get('id'))}}
+
+    documents = await collection.find(query, projection).sort('_id', -1).limit(limit + 1).to_list(None)
+    next_cursor = None
+    if len(documents) > limit:
+        documents = documents[:limit]
+        next_cursor = encode_cursor(id=documents[-1]['_id'])
+    return documents, next_cursor
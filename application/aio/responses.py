@@ -0,0 +1,13 @@
+from quart import request, Response
+from application.shared.responses import negotiate, encode
+
+
+def build_response(payload: dict) -> Response:
+    """
+    Async counterpart of application.shared.responses.build_response, with the same
+    content negotiation.
+    """
+    mimetype = negotiate(request.accept_mimetypes)
+    response = Response(encode(payload, mimetype), status=payload['status_code'], mimetype=mimetype)
+    response.vary.add('Accept')
+    return response
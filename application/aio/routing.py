@@ -0,0 +1,22 @@
+from pymongo import WriteConcern
+from quart import current_app
+from application.aio.db import collection
+from application.shared.routing import READ_PREFERENCES
+
+
+def for_lists(document):
+    """
+    The collection of a document with the read preference of the list endpoints.
+    """
+    return collection(document).with_options(
+        read_preference=READ_PREFERENCES[current_app.config.get('LIST_READ_PREFERENCE', 'primary')]
+    )
+
+
+def for_comments(document):
+    """
+    The collection of a document with the write concern of comment writes.
+    """
+    return collection(document).with_options(
+        write_concern=WriteConcern(**current_app.config.get('COMMENT_WRITE_CONCERN', {}))
+    )
@@ -0,0 +1,23 @@
+from application.aio.db import collection
+from application.models.user import User
+from application.serializers.raw import serialize_raw_post, serialize_raw_user
+
+
+async def load_authors(author_ids) -> dict:
+    """
+    Load and serialize the users with the given ids with a single $in query, by id.
+    """
+    author_ids = list(set(author_ids))
+    if not author_ids:
+        return {}
+    users = collection(User).find({'_id': {'$in': author_ids}})
+    return {user['_id']: serialize_raw_user(user) async for user in users}
+
+
+async def serialize_posts(posts: list) -> list:
+    """
+    Async counterpart of serialize_raw_posts: the same compiled raw serializers, with the
+    authors loaded through motor.
+    """
+    authors = await load_authors(post['author'] for post in posts if post.get('author'))
+    return [serialize_raw_post(post, authors) for post in posts]
@@ -0,0 +1,247 @@
+from bson import ObjectId
+from pymongo import ReturnDocument
+from quart import Blueprint, request
+from application.aio.db import collection, subclass_filter, bump, record_stats
+from application.aio.pagination import paginate
+from application.aio.responses import build_response
+from application.aio.routing import for_lists, for_comments
+from application.aio.serializers import serialize_posts
+from application.models.post import Post
+from application.models.user import User
+from application.models.comment import Comment
+from application.models.post_comment import PostComment
+from application.serializers.compiled import raw_serializer_for
+from application.shared.arguments import tag_filter
+from application.shared.constants import POST_TYPES, LIST_EXCLUDED_FIELDS, RECENT_COMMENTS
+from application.shared.projection import Projection
+from application.shared.post_types import POST_DOCUMENTS, POST_TYPE_FIELDS
+
+post_blueprint = Blueprint('post_blueprint', __name__)
+
+
+async def list_posts_page(document, args: dict) -> dict:
+    """
+    One page of a post list read through motor, serialized with the compiled raw serializers.
+    """
+    projection = Projection(args.get('fields'), document, exclude=LIST_EXCLUDED_FIELDS)
+    posts, next_cursor = await paginate(
+        for_lists(document), {**subclass_filter(document), **tag_filter(args)}, args,
+        projection=projection.to_mongo()
+    )
+    return {
+        'message': 'Posts listed successfully',
+        'posts': [projection.select(post) for post in await serialize_posts(posts)],
+        'next_cursor': next_cursor,
+        'status': 'success',
+        'status_code': 200
+    }
+
+
+@post_blueprint.route('/post/create/<post_type>', methods=['POST'])
+async def create_post(post_type: str):
+    """
+    Create a new post of a specific type.
+
+    Endpoint: /post/create/<post_type>
+    Method: POST
+
+    Parameters:
+    - post_type (str): Type of the post. Allowed values: 'text', 'image', 'link'.
+
+    Returns:
+    The same JSON response as the Flask endpoint.
+    """
+    try:
+        data: dict = await request.get_json()
+
+        if post_type not in POST_TYPES:
+            raise Exception('Invalid post type')
+
+        document = POST_DOCUMENTS[post_type]
+        field = POST_TYPE_FIELDS[document]
+        author = await collection(User).find_one({'email': data['author']})
+
+        post = document(title=data['title'], author=author and author['_id'], **{field: data[field]})
+        post.validate()
+        son = post.to_mongo()
+        son['_id'] = (await collection(document).insert_one(son)).inserted_id
+
+        await bump('post', *([f'author:{post.author_id}'] if post.author_id else []))
+        await record_stats(post, posts=1)
+
+        response = {
+            'message': 'Post created successfully',
+            'post': (await serialize_posts([son]))[0],
+            'status': 'success',
+            'status_code': 200
+        }
+    except Exception as e:
+        response = {
+            'message': str(e),
+            'status': 'error',
+            'status_code': 500
+        }
+    return build_response(response)
+
+
+@post_blueprint.route('/post/list', methods=['GET'])
+async def list_posts():
+    """
+    List the posts of all types, newest first, one page at a time.
+
+    Endpoint: /post/list
+    Method: GET
+
+    Query Parameters:
+    - limit (int, optional): Number of posts per page (default 20, max 100).
+    - after (str, optional): Cursor returned as next_cursor by the previous page.
+    - fields (str, optional): Comma-separated fields to return, e.g. 'title,author'.
+    - tag (str, optional, repeatable): Only list posts with this tag.
+    - mode (str, optional): 'all' (default) or 'any' of the tags given.
+
+    Returns:
+    The same JSON response as the Flask endpoint.
+    """
+    try:
+        response = await list_posts_page(Post, request.args)
+    except Exception as e:
+        response = {
+            'message': str(e),
+            'status': 'error',
+            'status_code': 500
+        }
+    return build_response(response)
+
+
+@post_blueprint.route('/post/list/<post_type>', methods=['GET'])
+async def list_posts_by_type(post_type: str):
+    """
+    List the posts of a specific type, newest first, one page at a time.
+
+    Endpoint: /post/list/<post_type>
+    Method: GET
+
+    Parameters:
+    - post_type (str): Type of the posts. Allowed values: 'text', 'image', 'link'.
+
+    Query Parameters:
+    - limit (int, optional): Number of posts per page (default 20, max 100).
+    - after (str, optional): Cursor returned as next_cursor by the previous page.
+    - fields (str, optional): Comma-separated fields to return, e.g. 'title,author'.
+    - tag (str, optional, repeatable): Only list posts with this tag.
+    - mode (str, optional): 'all' (default) or 'any' of the tags given.
+
+    Returns:
+    The same JSON response as the Flask endpoint.
+    """
+    try:
+        if post_type not in POST_TYPES:
+            raise Exception('Invalid post type')
+
+        response = await list_posts_page(POST_DOCUMENTS[post_type], request.args)
+    except Exception as e:
+        response = {
+            'message': str(e),
+            'status': 'error',
+            'status_code': 500
+        }
+    return build_response(response)
+
+
+@post_blueprint.route('/post/add_comment/<post_id>', methods=['POST'])
+async def add_comment_to_post(post_id: str):
+    """
+    Add a comment to a post.
+
+    Endpoint: /post/add_comment/<post_id>
+    Method: POST
+
+    Parameters:
+    - post_id (str): ID of the post.
+
+    The comment is stored before the post embeds and counts it, and is removed again when
+    the post does not exist. The comment id is assigned by the server.
+
+    Returns:
+    The same JSON response as the Flask endpoint.
+    """
+    try:
+        data: dict = await request.get_json()
+        if 'id' in data:
+            raise Exception('Comment id cannot be set')
+        comment = Comment(**data)
+        comment.validate()
+        post_id = ObjectId(post_id)
+        comments = for_comments(PostComment)
+
+        await comments.insert_one(PostComment(
+            id=comment.id, post=post_id, content=comment.content, name=comment.name
+        ).to_mongo())
+        post = await for_comments(Post).find_one_and_update(
+            {'_id': post_id},
+            {
+                '$push': {'comments': {'$each': [comment.to_mongo()], '$slice': -RECENT_COMMENTS}},
+                '$inc': {'comment_count': 1}
+            },
+            return_document=ReturnDocument.AFTER
+        )
+        if not post:
+            await comments.delete_one({'_id': comment.id})
+            raise Exception('Post not found')
+
+        post_document = Post._from_son(post)
+        await bump('post', *([f'author:{post_document.author_id}'] if post_document.author_id else []))
+        await record_stats(post_document, comments=1)
+
+        response = {
+            'message': 'Comment added successfully',
+            'post': (await serialize_posts([post]))[0],
+            'status': 'success',
+            'status_code': 200
+        }
+    except Exception as e:
+        response = {
+            'message': str(e),
+            'status': 'error',
+            'status_code': 500
+        }
+    return build_response(response)
+
+
+@post_blueprint.route('/post/<post_id>/comments', methods=['GET'])
+async def list_post_comments(post_id: str):
+    """
+    List the comments of a post, newest first, one page at a time.
+
+    Endpoint: /post/<post_id>/comments
+    Method: GET
+
+    Parameters:
+    - post_id (str): ID of the post.
+
+    Query Parameters:
+    - limit (int, optional): Number of comments per page (default 20, max 100).
+    - after (str, optional): Cursor returned as next_cursor by the previous page.
+
+    Returns:
+    The same JSON response as the Flask endpoint.
+    """
+    try:
+        serialize = raw_serializer_for(PostComment)
+        comments, next_cursor = await paginate(
+            for_lists(PostComment), {'post': ObjectId(post_id)}, request.args
+        )
+        response = {
+            'message': 'Comments listed successfully',
+            'comments': [serialize(comment) for comment in comments],
+            'next_cursor': next_cursor,
+            'status': 'success',
+            'status_code': 200
+        }
+    except Exception as e:
+        response = {
+            'message': str(e),
+            'status': 'error',
+            'status_code': 500
+        }
+    return build_response(response)
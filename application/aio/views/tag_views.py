@@ -0,0 +1,89 @@
+from quart import Blueprint, request
+from application.aio.db import collection, bump
+from application.aio.responses import build_response
+from application.aio.routing import for_lists
+from application.models.tag import Tag
+from application.serializers.compiled import raw_serializer_for
+from application.shared.projection import Projection
+
+tag_blueprint = Blueprint('tag_blueprint', __name__)
+
+
+@tag_blueprint.route('/tag/create', methods=['POST'])
+async def create_tag():
+    """
+    Create a new tag.
+
+    Endpoint: /tag/create
+    Method: POST
+
+    Parameters:
+    - name (str): Name of the tag.
+
+    Returns:
+    The same JSON response as the Flask endpoint.
+    """
+    try:
+        data: dict = await request.get_json()
+
+        if 'name' not in data:
+            raise Exception('Tag name not provided')
+
+        tag = Tag(name=data['name'])
+        tag.validate()
+        son = tag.to_mongo()
+        son['_id'] = (await collection(Tag).insert_one(son)).inserted_id
+
+        await bump('tag')
+
+        response = {
+            'message': 'Tag created successfully',
+            'tag': raw_serializer_for(Tag)(son),
+            'status': 'success',
+            'status_code': 201
+        }
+    except Exception as e:
+        response = {
+            'message': str(e),
+            'status': 'error',
+            'status_code': 500
+        }
+    return build_response(response)
+
+
+@tag_blueprint.route('/tag/list', methods=['GET'])
+async def list_tags():
+    """
+    List all tags.
+
+    Endpoint: /tag/list
+    Method: GET
+
+    Query Parameters:
+    - fields (str, optional): Comma-separated fields to return, e.g. 'name'.
+
+    Returns:
+    The same JSON response as the Flask endpoint.
+    """
+    try:
+        projection = Projection(request.args.get('fields'), Tag)
+        serialize = raw_serializer_for(Tag)
+
+        tags = []
+        # the declared fields by default, leaving out the posts array of tags not migrated yet
+        async for tag in for_lists(Tag).find({}, projection.to_mongo() or {'posts': 0}):
+            tags.append(projection.select(serialize(tag)))
+
+        response = {
+            'message': 'Tags listed successfully',
+            'tags': tags,
+            'status': 'success',
+            'status_code': 200
+        }
+    except Exception as e:
+        response = {
+            'message': str(e),
+            'status': 'error',
+            'status_code': 500
+        }
+    return build_response(response)
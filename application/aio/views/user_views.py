@@ -0,0 +1,48 @@
+from quart import Blueprint, request
+from application.aio.db import collection
+from application.aio.responses import build_response
+from application.models.user import User
+from application.serializers.raw import serialize_raw_user
+
+user_blueprint = Blueprint('user_blueprint', __name__)
+
+
+@user_blueprint.route('/user/create', methods=['POST'])
+async def create_user():
+    """
+    Create a new user.
+
+    Endpoint: /user/create
+    Method: POST
+
+    Parameters:
+    - email (str): Email of the user.
+    - first_name (str): First name of the user.
+    - last_name (str): Last name of the user.
+
+    Returns:
+    The same JSON response as the Flask endpoint.
+    """
+    try:
+        data: dict = await request.get_json()
+        user: User = User(
+            email=data['email'],
+            first_name=data['first_name'],
+            last_name=data['last_name']
+        )
+        user.validate()
+        son = user.to_mongo()
+        son['_id'] = (await collection(User).insert_one(son)).inserted_id
+        response = {
+            'message': 'User created successfully',
+            'user': serialize_raw_user(son),
+            'status': 'success',
+            'status_code': 200
+        }
+    except Exception as e:
+        response = {
+            'message': str(e),
+            'status': 'error',
+            'status_code': 500
+        }
+    return build_response(response)
@@ -0,0 +1,29 @@
+import click
+from flask.cli import AppGroup
+from application.models.post import Post
+from application.models.post_comment import PostComment
+from application.shared.constants import RECENT_COMMENTS
+
+comment_cli = AppGroup('comment', help='Manage post comments.')
+
+
+@comment_cli.command('migrate')
+def migrate_comments():
+    """
+    Move the embedded comments of posts written before comments had their own collection
+    into the comment collection, keeping only the latest ones on the post.
+    """
+    migrated = 0
+    for post in Post.objects(__raw__={'comment_count': {'$exists': False}}):
+        comments = list(post.comments)
+        if comments:
+            PostComment.objects.insert([
+                PostComment(id=comment.id, post=post, content=comment.content, name=comment.name)
+                for comment in comments
+            ], load_bulk=False)
+        Post.objects(id=post.id).update_one(
+            set__comments=comments[-RECENT_COMMENTS:],
+            set__comment_count=len(comments)
+        )
+        migrated += 1
+    click.echo(f'Migrated the comments of {migrated} posts')
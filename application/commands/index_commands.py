@@ -0,0 +1,63 @@
+import click
+from flask.cli import AppGroup
+from pymongo.errors import OperationFailure
+from application.models.user import User
+from application.models.post import Post
+from application.models.text_post import TextPost
+from application.models.image_post import ImagePost
+from application.models.link_post import LinkPost
+from application.models.tag import Tag
+from application.models.post_comment import PostComment
+
+index_cli = AppGroup('index', help='Manage the MongoDB indexes declared on the models.')
+
+INDEXED_DOCUMENTS = [User, Post, TextPost, ImagePost, LinkPost, Tag, PostComment]
+
+
+def unused_indexes(document) -> list:
+    """
+    Names of the indexes of a document's collection that have not served any operation
+    since the server started, according to $indexStats.
+    """
+    return [
+        stats['name'] for stats in document._get_collection().aggregate([{'$indexStats': {}}])
+        if stats['name'] != '_id_' and stats['accesses']['ops'] == 0
+    ]
+
+
+@index_cli.command('sync')
+def sync_indexes():
+    """
+    Create the missing indexes and report the unused or undeclared ones.
+
+    Indexes are built with background=True (see meta['index_background']) so this can
+    run as a deploy step against a live database; models never build indexes on import.
+    """
+    failed = False
+    for document in INDEXED_DOCUMENTS:
+        name = document.__name__
+        try:
+            existing = document._get_collection().index_information()
+            document.ensure_indexes()
+        except OperationFailure as e:
+            failed = True
+            click.echo(f'{name}: failed to create indexes: {e}', err=True)
+            continue
+
+        for index, info in document._get_collection().index_information().items():
+            if index not in existing:
+                click.echo(f'{name}: created {index} {info["key"]}')
+
+    documents = {document._get_collection_name(): document for document in INDEXED_DOCUMENTS}
+    for document in documents.values():
+        name = document._get_collection_name()
+        for index in document.compare_indexes()['extra']:
+            click.echo(f'{name}: undeclared index {index}')
+        try:
+            for index in unused_indexes(document):
+                click.echo(f'{name}: unused index {index}')
+        except OperationFailure as e:
+            click.echo(f'{name}: cannot read index stats: {e}', err=True)
+
+    if failed:
+        raise click.exceptions.Exit(1)
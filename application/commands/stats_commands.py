@@ -0,0 +1,53 @@
+from datetime import datetime
+import click
+from flask.cli import AppGroup
+from application.models.post import Post
+from application.models.stat import Stat
+
+stats_cli = AppGroup('stats', help='Manage the post and comment statistics.')
+
+
+def rebuild_pipelines(rebuilt_at: datetime) -> list:
+    """
+    One aggregation per kind of counter, each grouping the posts into Stat documents and
+    $merge-ing them into the stat collection.
+    """
+    def counters(key) -> list:
+        return [
+            {'$group': {
+                '_id': key,
+                'posts': {'$sum': 1},
+                'comments': {'$sum': {'$ifNull': ['$comment_count', 0]}}
+            }},
+            {'$set': {'rebuilt_at': rebuilt_at}},
+            {'$merge': {
+                'into': Stat._get_collection_name(),
+                'whenMatched': 'replace',
+                'whenNotMatched': 'insert'
+            }}
+        ]
+
+    return [
+        counters('total'),
+        counters({'$concat': ['type:', '$_cls']}),
+        [{'$match': {'author': {'$ne': None}}}]
+        + counters({'$concat': ['author:', {'$toString': '$author'}]}),
+        [{'$unwind': '$tags'}] + counters({'$concat': ['tag:', '$tags']})
+    ]
+
+
+@stats_cli.command('rebuild')
+def rebuild_stats():
+    """
+    Recompute every counter from the posts, then delete the counters that no post counts
+    towards any more. Writes made while it runs may be lost; run it when the counters have
+    drifted, e.g. after restoring posts, not routinely.
+    """
+    # truncated to the millisecond precision of BSON dates, to match the stored value
+    now = datetime.utcnow()
+    rebuilt_at = now.replace(microsecond=now.microsecond // 1000 * 1000)
+    for pipeline in rebuild_pipelines(rebuilt_at):
+        list(Post._get_collection().aggregate(pipeline))
+    deleted = Stat._get_collection().delete_many({'rebuilt_at': {'$ne': rebuilt_at}}).deleted_count
+    rebuilt = Stat.objects(rebuilt_at=rebuilt_at).count()
+    click.echo(f'Rebuilt {rebuilt} counters, deleted {deleted} stale ones')
@@ -0,0 +1,34 @@
+import click
+from flask.cli import AppGroup
+from pymongo import UpdateOne
+from application.models.post import Post
+from application.models.tag import Tag
+
+tag_cli = AppGroup('tag', help='Manage tags.')
+
+
+@tag_cli.command('migrate')
+def migrate_tags():
+    """
+    Move tags written before post_count to it: count the posts of every tag from Post.tags
+    and drop the posts reference array the tags used to carry.
+
+    Can be run again, e.g. to repair counters; tags are updated while posts may be tagged,
+    so a concurrent tagging can be counted twice or not at all until the next run.
+    """
+    counts = {
+        count['_id']: count['count'] for count in Post.objects.aggregate([
+            {'$unwind': '$tags'},
+            {'$group': {'_id': '$tags', 'count': {'$sum': 1}}}
+        ])
+    }
+    requests = [
+        UpdateOne({'_id': tag['_id']}, {
+            '$set': {'post_count': counts.get(tag['name'], 0)},
+            '$unset': {'posts': ''}
+        })
+        for tag in Tag.objects.only('name').as_pymongo()
+    ]
+    if requests:
+        Tag._get_collection().bulk_write(requests, ordered=False)
+    click.echo(f'Migrated {len(requests)} tags')
@@ -0,0 +1,76 @@
+import os
+from application.shared.constants import (
+    COMMENT_QUEUE_SIZE, COMMENT_QUEUE_BATCH_SIZE, COMMENT_QUEUE_INTERVAL, COMMENT_QUEUE_PUT_TIMEOUT
+)
+
+# MongoClient options read from the environment: option name -> (variable, type)
+MONGODB_CLIENT_OPTIONS = {
+    'maxPoolSize': ('MONGODB_MAX_POOL_SIZE', int),
+    'minPoolSize': ('MONGODB_MIN_POOL_SIZE', int),
+    'maxIdleTimeMS': ('MONGODB_MAX_IDLE_TIME_MS', int),
+    'waitQueueTimeoutMS': ('MONGODB_WAIT_QUEUE_TIMEOUT_MS', int),
+    'connectTimeoutMS': ('MONGODB_CONNECT_TIMEOUT_MS', int),
+    'socketTimeoutMS': ('MONGODB_SOCKET_TIMEOUT_MS', int),
+    'serverSelectionTimeoutMS': ('MONGODB_SERVER_SELECTION_TIMEOUT_MS', int),
+    'compressors': ('MONGODB_COMPRESSORS', str),
+    'readPreference': ('MONGODB_READ_PREFERENCE', str),
+    'w': ('MONGODB_W', str),
+    'journal': ('MONGODB_JOURNAL', lambda value: value.lower() in ('1', 'true')),
+    'replicaSet': ('MONGODB_REPLICA_SET', str)
+}
+
+
+def _write_concern_w(value: str):
+    return int(value) if value.isdigit() else value
+
+
+def mongodb_settings() -> dict:
+    """
+    The MONGODB_SETTINGS of the app: db, host and port, plus every MongoClient option of
+    MONGODB_CLIENT_OPTIONS set in the environment. Options left unset keep the driver
+    defaults.
+    """
+    settings = {
+        'db': os.environ.get('MONGODB_DB', 'tumblelog'),
+        'host': os.environ.get('MONGODB_HOST', 'localhost'),
+        'port': int(os.environ.get('MONGODB_PORT', 27017))
+    }
+    for option, (variable, parse) in MONGODB_CLIENT_OPTIONS.items():
+        if variable in os.environ:
+            settings[option] = parse(os.environ[variable])
+    if 'w' in settings:
+        settings['w'] = _write_concern_w(settings['w'])
+    return settings
+
+
+def load_config() -> dict:
+    """
+    The app configuration read from the environment.
+
+    - MONGODB_SETTINGS: see mongodb_settings().
+    - LIST_READ_PREFERENCE: read preference of the list endpoints, 'primary' by default.
+      With any other mode list reads may go to lagging secondaries, so list responses are
+      neither cached nor given an ETag, see cached_response().
+    - COMMENT_WRITE_CONCERN: write concern of comment writes, w=1 by default, i.e.
+      acknowledged by the primary alone whatever the write concern of the connection.
+    - QUERY_PROFILER: when set, count the Mongo commands of every request, report them in
+      the X-DB-Query-Count and X-DB-Query-Time-Ms headers and log likely N+1 queries.
+    - COMMENT_QUEUE: when set, comments are written behind by a CommentQueue, see
+      application.shared.comment_queue; COMMENT_QUEUE_SIZE, COMMENT_QUEUE_BATCH_SIZE,
+      COMMENT_QUEUE_INTERVAL (seconds) and COMMENT_QUEUE_PUT_TIMEOUT (seconds) tune it.
+    """
+    return {
+        'MONGODB_SETTINGS': mongodb_settings(),
+        'LIST_READ_PREFERENCE': os.environ.get('LIST_READ_PREFERENCE', 'primary'),
+        'COMMENT_WRITE_CONCERN': {'w': _write_concern_w(os.environ.get('COMMENT_WRITE_CONCERN_W', '1'))},
+        'QUERY_PROFILER': os.environ.get('QUERY_PROFILER', '').lower() in ('1', 'true'),
+        'COMMENT_QUEUE': os.environ.get('COMMENT_QUEUE', '').lower() in ('1', 'true'),
+        'COMMENT_QUEUE_SIZE': int(os.environ.get('COMMENT_QUEUE_SIZE', COMMENT_QUEUE_SIZE)),
+        'COMMENT_QUEUE_BATCH_SIZE': int(
+            os.environ.get('COMMENT_QUEUE_BATCH_SIZE', COMMENT_QUEUE_BATCH_SIZE)
+        ),
+        'COMMENT_QUEUE_INTERVAL': float(os.environ.get('COMMENT_QUEUE_INTERVAL', COMMENT_QUEUE_INTERVAL)),
+        'COMMENT_QUEUE_PUT_TIMEOUT': float(
+            os.environ.get('COMMENT_QUEUE_PUT_TIMEOUT', COMMENT_QUEUE_PUT_TIMEOUT)
+        )
+    }
@@ -0,0 +1,49 @@
+from mongoengine import *
+from pymongo import UpdateOne
+from application.shared.cache import LRUCache
+from application.shared.constants import VERSION_POLL_SIZE, VERSION_POLL_INTERVAL
+
+# versions read by CollectionVersion.polled(), by name, reused for VERSION_POLL_INTERVAL seconds
+polled_versions = LRUCache(VERSION_POLL_SIZE, VERSION_POLL_INTERVAL)
+
+
+class CollectionVersion(Document):
+    """
+    A counter per collection, bumped by every view that writes to the collection, used as
+    a cheap token to tell whether cached list responses are still current.
+    """
+    name = StringField(primary_key=True)
+    version = IntField(default=0)
+
+    meta = {'auto_create_index': False}
+
+    @classmethod
+    def bump(cls, *names: str):
+        if not names:
+            return
+        cls._get_collection().bulk_write([
+            UpdateOne({'_id': name}, {'$inc': {'version': 1}}, upsert=True) for name in names
+        ], ordered=False)
+        for name in names:
+            polled_versions.delete(name)
+
+    @classmethod
+    def current(cls, names: list) -> dict:
+        versions = {collection.name: collection.version for collection in cls.objects(name__in=names)}
+        return {name: versions.get(name, 0) for name in names}
+
+    @classmethod
+    def polled(cls, names: list) -> dict:
+        """
+        Like current(), but reusing the versions read less than VERSION_POLL_INTERVAL seconds
+        ago, so that in-process caches can check their entries against the versions without
+        reading them on every hit. Bumps made by other processes are seen within the interval,
+        bumps made by this process right away.
+        """
+        versions = {name: polled_versions.get(name) for name in names}
+        missing = [name for name, version in versions.items() if version is None]
+        if missing:
+            for name, version in cls.current(missing).items():
+                polled_versions.set(name, version)
+                versions[name] = version
+        return versions
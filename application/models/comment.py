@@ -1,13 +1,13 @@
+from bson import ObjectId
 from mongoengine import *
+from application.serializers.compiled import serializable, serializer_for
 
 
+@serializable()
 class Comment(EmbeddedDocument):
+    id = ObjectIdField(required=True, default=ObjectId)
     content = StringField()
     name = StringField(max_length=120)
 
     def to_dict(self):
-        return {
-            'id': str(self.id),  # convert ObjectId to string
-            'content': self.content,
-            'name': self.name
-        }
+        return serializer_for(type(self))(self)
@@ -1,21 +1,67 @@
+from bson import DBRef
 from mongoengine import *
 from application.models.user import User
 from application.models.comment import Comment
+from application.serializers.compiled import serializable, serializer_for
 
 
+@serializable()
 class Post(Document):
     title = StringField(max_length=120, required=True)
     author = ReferenceField(User, reverse_delete_rule=CASCADE)
     tags = ListField(StringField(max_length=30))
+    # only the latest RECENT_COMMENTS comments, all of them are PostComment documents
     comments = ListField(EmbeddedDocumentField(Comment))
+    comment_count = IntField(default=0)
 
-    meta = {'allow_inheritance': True}
+    meta = {
+        'allow_inheritance': True,
+        'auto_create_index': False,
+        'index_background': True,
+        # mongoengine prepends _cls to every index of the Post hierarchy
+        'indexes': [
+            '-id',
+            ('tags', '-id'),
+            # the posts of an author, newest first, whatever their type
+            {'fields': ['author', '-id'], 'cls': False},
+            # full-text search over the post types; the fields are given as (name, 'text')
+            # pairs since content and link_url are only declared by the subclasses, and
+            # without _cls so that one search can span every post type
+            {
+                'fields': [('title', 'text'), ('content', 'text'), ('link_url', 'text')],
+                'cls': False,
+                'name': 'post_text',
+                'weights': {'title': 10, 'content': 5, 'link_url': 1},
+                'default_language': 'english'
+            }
+        ]
+    }
 
-    def to_dict(self):
-        return {
-            'id': str(self.id),  # convert ObjectId to string
-            'title': self.title,
-            'author': self.author.to_dict(),
-            'tags': self.tags,
-            'comments': self.comments
+    @property
+    def author_id(self):
+        """
+        The id of the author, without dereferencing it.
+        """
+        author = self._data.get('author')
+        return getattr(author, 'id', author)
+
+    @staticmethod
+    def prefetch_authors(posts: list) -> list:
+        """
+        Resolve the authors of a page of posts with a single $in query, so that
+        serializing N posts does not issue one User query per post.
+        """
+        author_ids = {
+            post._data['author'].id for post in posts
+            if isinstance(post._data.get('author'), DBRef)
         }
+        if author_ids:
+            authors = {user.id: user for user in User.objects(id__in=list(author_ids))}
+            for post in posts:
+                author = post._data.get('author')
+                if isinstance(author, DBRef) and author.id in authors:
+                    post._data['author'] = authors[author.id]
+        return posts
+
+    def to_dict(self):
+        return serializer_for(type(self))(self)
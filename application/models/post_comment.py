@@ -0,0 +1,29 @@
+from mongoengine import *
+from application.models.post import Post
+from application.models.comment import Comment
+from application.serializers.compiled import serializable, serializer_for
+
+
+@serializable('post')
+class PostComment(Document):
+    """
+    A comment stored in its own collection, so that a post document does not grow with its
+    comment history. Posts only embed the latest few comments, with the same ids.
+    """
+    post = ReferenceField(Post, reverse_delete_rule=CASCADE, required=True)
+    content = StringField()
+    name = StringField(max_length=120)
+
+    meta = {
+        'auto_create_index': False,
+        'index_background': True,
+        'indexes': [
+            ('post', '-id')
+        ]
+    }
+
+    def to_comment(self) -> Comment:
+        return Comment(id=self.id, content=self.content, name=self.name)
+
+    def to_dict(self):
+        return serializer_for(type(self))(self)
@@ -0,0 +1,105 @@
+from collections import Counter
+from mongoengine import *
+from pymongo import UpdateOne
+
+
+class Stat(Document):
+    """
+    Counters of posts and comments in total, per post type, per tag and per author, kept
+    up to date by the views writing posts so that dashboards read them without scanning
+    the posts. The id names the counter: 'total', 'type:<_cls>', 'tag:<name>' or
+    'author:<user id>'. `flask stats rebuild` recomputes them from the posts.
+    """
+    id = StringField(primary_key=True)
+    posts = IntField(default=0)
+    comments = IntField(default=0)
+    rebuilt_at = DateTimeField()
+
+    meta = {'auto_create_index': False}
+
+    @staticmethod
+    def keys(post, tags: list = None) -> list:
+        """
+        The ids of the counters a post counts towards, with its current tags unless given.
+        """
+        keys = ['total', f'type:{post._class_name}']
+        if post.author_id is not None:
+            keys.append(f'author:{post.author_id}')
+        keys += [f'tag:{tag}' for tag in (post.tags if tags is None else tags)]
+        return keys
+
+    @staticmethod
+    def updates(posts: Counter, comments: Counter = None) -> list:
+        """
+        The upserts adding the given amounts to the counters, by counter id.
+        """
+        comments = comments or Counter()
+        return [
+            UpdateOne(
+                {'_id': key}, {'$inc': {'posts': posts[key], 'comments': comments[key]}}, upsert=True
+            )
+            for key in set(posts) | set(comments)
+            if posts[key] or comments[key]
+        ]
+
+    @staticmethod
+    def changes(post, posts: int = 0, comments: int = 0, tags: list = None) -> tuple:
+        """
+        The (posts, comments) increments of a change of the number of posts or comments of
+        a post, towards its counters or towards the given tags only.
+        """
+        keys = [f'tag:{tag}' for tag in tags] if tags is not None else Stat.keys(post)
+        return Counter(dict.fromkeys(keys, posts)), Counter(dict.fromkeys(keys, comments))
+
+    @classmethod
+    def increment(cls, posts: Counter, comments: Counter = None):
+        """
+        Add the given amounts to the counters, by counter id, with one unordered bulk write.
+        """
+        requests = cls.updates(posts, comments)
+        if requests:
+            cls._get_collection().bulk_write(requests, ordered=False)
+
+    @classmethod
+    def record(cls, post, posts: int = 0, comments: int = 0, tags: list = None):
+        """
+        Count a change of the number of posts or comments of a post towards its counters,
+        or towards the given tags only.
+        """
+        cls.increment(*cls.changes(post, posts, comments, tags))
+
+    @classmethod
+    def transfer(cls, old: str, new: str, posts: int, comments: int):
+        """
+        Move an amount of posts and comments from one counter to another, e.g. when a post
+        changes author; a None id stands for no counter.
+        """
+        posts_increments, comments_increments = Counter(), Counter()
+        for key, sign in ((old, -1), (new, 1)):
+            if key is not None:
+                posts_increments[key] += sign * posts
+                comments_increments[key] += sign * comments
+        cls.increment(posts_increments, comments_increments)
+
+    @classmethod
+    def rename(cls, old: str, new: str):
+        """
+        Move the counters of a renamed tag or other key to its new id.
+        """
+        stat = cls._get_collection().find_one_and_delete({'_id': old})
+        if stat:
+            cls.increment(Counter({new: stat.get('posts', 0)}), Counter({new: stat.get('comments', 0)}))
+
+    @classmethod
+    def read(cls, keys: list) -> dict:
+        """
+        The counters with the given ids as {id: {'posts': n, 'comments': n}}, zero when missing.
+        """
+        stats = {stat['_id']: stat for stat in cls.objects(id__in=keys).as_pymongo()}
+        return {
+            key: {
+                'posts': stats.get(key, {}).get('posts', 0),
+                'comments': stats.get(key, {}).get('comments', 0)
+            }
+            for key in keys
+        }
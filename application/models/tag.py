@@ -1,14 +1,54 @@
 from mongoengine import *
 from application.models.post import Post
+from application.serializers.compiled import serializable, serializer_for
 
 
+@serializable()
 class Tag(Document):
     name = StringField(max_length=120, required=True)
-    posts = ListField(ReferenceField(Post, reverse_delete_rule=CASCADE))
+    # maintained by the views that tag, untag and delete posts; posts are found through Post.tags
+    post_count = IntField(default=0)
+
+    meta = {
+        'auto_create_index': False,
+        'index_background': True,
+        'indexes': [
+            {'fields': ['name'], 'unique': True}
+        ],
+        # tags written before post_count carry the dropped posts reference array until
+        # `flask tag migrate` counts their posts and removes it
+        'strict': False
+    }
+
+    @classmethod
+    def live_counts(cls) -> list:
+        """
+        Count the posts of every tag with a single aggregation. Requires MongoDB 5.0+.
+
+        The tags index of Post is (_cls, tags, _id), as mongoengine prepends _cls to it, so
+        each lookup also matches _cls against the classes of the hierarchy to count from
+        that index instead of scanning the posts.
+        """
+        return [
+            {
+                'id': str(tag['_id']),  # convert ObjectId to string
+                'name': tag['name'],
+                'post_count': tag['post_count']
+            }
+            for tag in cls.objects.aggregate([
+                {'$lookup': {
+                    'from': Post._get_collection_name(),
+                    'localField': 'name',
+                    'foreignField': 'tags',
+                    'pipeline': [
+                        {'$match': {'_cls': {'$in': list(Post._subclasses)}}},
+                        {'$count': 'count'}
+                    ],
+                    'as': 'posts'
+                }},
+                {'$project': {'name': 1, 'post_count': {'$ifNull': [{'$first': '$posts.count'}, 0]}}}
+            ])
+        ]
 
     def to_dict(self):
-        return {
-            'id': str(self.id),  # convert ObjectId to string
-            'name': self.name,
-            'posts': self.posts
-        }
+        return serializer_for(type(self))(self)
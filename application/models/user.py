@@ -1,15 +1,118 @@
 from mongoengine import *
+from mongoengine import signals
+from application.models.collection_version import CollectionVersion
+from application.serializers.compiled import serializable, serializer_for
+from application.shared.cache import LRUCache
+from application.shared.constants import (
+    USER_CACHE_SIZE, USER_CACHE_TTL, AUTHOR_PAGE_CACHE_SIZE, AUTHOR_PAGE_CACHE_TTL
+)
 
+# (user version, user) by email; only existing users are cached so a newly created user is
+# never missed, and entries cached under an older polled 'user' CollectionVersion are not served
+user_cache = LRUCache(USER_CACHE_SIZE, USER_CACHE_TTL)
+# (author page versions, first page of the posts of an author) by author id, served by
+# /user/<user_id>/posts
+author_page_cache = LRUCache(AUTHOR_PAGE_CACHE_SIZE, AUTHOR_PAGE_CACHE_TTL)
+# the CollectionVersion bumped by the writes that change the pages of every author
+ALL_AUTHOR_PAGES = 'author_pages'
 
+
+def author_page_versions(author_id) -> list:
+    """
+    The names of the CollectionVersions a cached first page of an author is valid for: one
+    of the author, bumped by invalidate_author_pages(), and one of every author.
+    """
+    return [f'author:{author_id}', ALL_AUTHOR_PAGES]
+
+
+def invalidate_author_pages(*author_ids):
+    """
+    Invalidate the cached first page of the given authors, in every process, after a write
+    to one of their posts or to the author.
+    """
+    author_ids = {str(author_id) for author_id in author_ids if author_id is not None}
+    for author_id in author_ids:
+        author_page_cache.delete(author_id)
+    CollectionVersion.bump(*[f'author:{author_id}' for author_id in author_ids])
+
+
+def invalidate_all_author_pages():
+    """
+    Invalidate the cached first page of every author, e.g. after a tag rename.
+    """
+    author_page_cache.clear()
+    CollectionVersion.bump(ALL_AUTHOR_PAGES)
+
+
+@serializable()
 class User(Document):
     email = StringField(required=True)
     first_name = StringField(max_length=50)
     last_name = StringField(max_length=50)
 
+    meta = {
+        'auto_create_index': False,
+        'index_background': True,
+        'indexes': [
+            {'fields': ['email'], 'unique': True}
+        ]
+    }
+
+    @staticmethod
+    def _cached(email: str, version: int):
+        entry = user_cache.get(email, valid=lambda entry: entry[0] == version)
+        return None if entry is None else entry[1]
+
+    @classmethod
+    def by_email(cls, email: str):
+        """
+        Find a user by email, going to the database only on a cache miss.
+
+        Cached users are only served while the 'user' CollectionVersion they were cached
+        under is current, so an update or delete made by any process evicts them within
+        VERSION_POLL_INTERVAL seconds, see CollectionVersion.polled().
+        """
+        version = CollectionVersion.polled(['user'])['user']
+        user = cls._cached(email, version)
+        if user is None:
+            user = cls.objects(email=email).first()
+            if user:
+                user_cache.set(email, (version, user))
+        return user
+
+    @classmethod
+    def by_emails(cls, emails: list) -> dict:
+        """
+        Find users by email, loading the ones that are not cached with a single $in query.
+        """
+        version = CollectionVersion.polled(['user'])['user']
+        users = {}
+        missing = []
+        for email in set(emails):
+            user = cls._cached(email, version)
+            if user is None:
+                missing.append(email)
+            else:
+                users[email] = user
+        if missing:
+            for user in cls.objects(email__in=missing):
+                user_cache.set(user.email, (version, user))
+                users[user.email] = user
+        return users
+
     def to_dict(self):
-        return {
-            'id': str(self.id),  # convert ObjectId to string
-            'email': self.email,
-            'first_name': self.first_name,
-            'last_name': self.last_name
-        }
+        return serializer_for(type(self))(self)
+
+
+def invalidate_user(sender, document, **kwargs):
+    # match on id as well, since the user may have been cached under a previous email
+    user_cache.delete(document.email)
+    user_cache.delete_where(lambda entry: entry[1].id == document.id)
+    # a new user is not referenced by any post yet, so it cannot change a post listing
+    if not kwargs.get('created'):
+        invalidate_author_pages(document.id)
+        CollectionVersion.bump('user')
+
+
+signals.post_save.connect(invalidate_user, sender=User)
+signals.post_delete.connect(invalidate_user, sender=User)
@@ -0,0 +1,150 @@
+from mongoengine import Document
+from mongoengine.fields import EmbeddedDocumentField, ListField, ObjectIdField, ReferenceField
+
+# serializers of mongoengine documents and of raw (as_pymongo) documents, by document class
+_serializers = {}
+_raw_serializers = {}
+# fields left out of the serialized documents, by the document class declaring the exclusion
+_excluded = {}
+
+
+def serializable(*exclude: str):
+    """
+    Class decorator compiling the serializers of a document class as soon as it is defined.
+
+    The serializers are generated from the class' _fields: ObjectIds become strings,
+    references and embedded documents are serialized with the serializer of their own
+    class, and the fields named in exclude are left out. Subclasses inherit the exclusions.
+    """
+    def decorator(document_class):
+        _excluded[document_class] = set(exclude)
+        _serializers[document_class] = compile_serializer(document_class)
+        _raw_serializers[document_class] = compile_serializer(document_class, raw=True)
+        return document_class
+    return decorator
+
+
+def serializer_for(document_class):
+    """
+    The serializer of a document class: a function turning a document into a dict.
+    """
+    serializer = _serializers.get(document_class)
+    if serializer is None:
+        serializer = _serializers[document_class] = compile_serializer(document_class)
+    return serializer
+
+
+def raw_serializer_for(document_class):
+    """
+    The raw serializer of a document class: a function turning a document read with
+    as_pymongo() into the same dict as serializer_for(document_class). References are
+    taken from its second argument, a dict of already serialized documents by id.
+    """
+    serializer = _raw_serializers.get(document_class)
+    if serializer is None:
+        serializer = _raw_serializers[document_class] = compile_serializer(document_class, raw=True)
+    return serializer
+
+
+def _object_id(value):
+    return None if value is None else str(value)
+
+
+def _reference(value):
+    if value is None:
+        return None
+    if isinstance(value, Document):
+        return serializer_for(type(value))(value)
+    return str(getattr(value, 'id', value))  # a DBRef or ObjectId that was not dereferenced
+
+
+def _raw_reference(value, related):
+    return None if value is None or related is None else related.get(value)
+
+
+def _embedded(value):
+    return None if value is None else serializer_for(type(value))(value)
+
+
+def _raw_embedded(document_class):
+    def serialize(value):
+        return None if value is None else raw_serializer_for(document_class)(value)
+    return serialize
+
+
+def _excluded_fields(document_class) -> set:
+    excluded = set()
+    for base in document_class.__mro__:
+        excluded |= _excluded.get(base, set())
+    return excluded
+
+
+def _value_source(name: str, field, raw: bool, namespace: dict) -> str:
+    """
+    Python source of the expression reading a field from a document (raw or not),
+    with the field's default when a raw document does not have it.
+    """
+    if not raw:
+        if isinstance(field, ReferenceField):
+            return f'document.{name}'  # dereferences, unless already resolved in bulk
+        return f'data.get({name!r})'
+    if field.default is None:
+        return f'son.get({field.db_field!r})'
+    namespace[f'_default_{name}'] = field.default
+    default = f'_default_{name}()' if callable(field.default) else f'_default_{name}'
+    return f'(son[{field.db_field!r}] if {field.db_field!r} in son else {default})'
+
+
+def _convert_source(field, value: str, raw: bool, namespace: dict) -> str:
+    """
+    Python source of the expression converting a field value into its JSON-compatible form.
+    """
+    if isinstance(field, ObjectIdField):
+        return f'_object_id({value})'
+    if isinstance(field, ReferenceField):
+        return f'_raw_reference({value}, related)' if raw else f'_reference({value})'
+    if isinstance(field, EmbeddedDocumentField):
+        if not raw:
+            return f'_embedded({value})'
+        name = f'_embedded_{len(namespace)}'
+        namespace[name] = _raw_embedded(field.document_type)
+        return f'{name}({value})'
+    if isinstance(field, ListField) and field.field is not None:
+        item = _convert_source(field.field, 'item', raw, namespace)
+        if item != 'item':
+            return f'[{item} for item in {value} or ()]'
+    return value
+
+
+def compile_serializer(document_class, raw: bool = False):
+    """
+    Generate the serializer of a document class, as one function building the whole dict
+    in a single expression from the class' fields.
+    """
+    excluded = _excluded_fields(document_class)
+    names = ['id'] if 'id' in document_class._fields else []
+    names += [
+        name for name in document_class._fields_ordered
+        if name != 'id' and not name.startswith('_') and name not in excluded
+    ]
+
+    namespace = {
+        '_object_id': _object_id,
+        '_reference': _reference,
+        '_raw_reference': _raw_reference,
+        '_embedded': _embedded
+    }
+    items = []
+    for name in names:
+        field = document_class._fields[name]
+        value = _value_source(name, field, raw, namespace)
+        items.append(f'        {name!r}: {_convert_source(field, value, raw, namespace)},')
+
+    if raw:
+        header = ['def serialize(son, related=None):']
+    else:
+        header = ['def serialize(document):', '    data = document._data']
+    source = '\n'.join(header + ['    return {'] + items + ['    }'])
+
+    exec(compile(source, f'<serializer of {document_class.__name__}>', 'exec'), namespace)
+    return namespace['serialize']
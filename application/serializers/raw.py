@@ -0,0 +1,27 @@
+from mongoengine.base import get_document
+from application.models.user import User
+from application.serializers.compiled import raw_serializer_for
+
+
+def serialize_raw_user(user: dict) -> dict:
+    return raw_serializer_for(User)(user)
+
+
+def serialize_raw_post(post: dict, authors: dict) -> dict:
+    """
+    Serialize a post document read with as_pymongo() into the same dict as to_dict() on the
+    post class named by its _cls, taking the author from the already serialized authors by id.
+    """
+    return raw_serializer_for(get_document(post.get('_cls', 'Post')))(post, authors)
+
+
+def serialize_raw_posts(posts: list) -> list:
+    """
+    Serialize a batch of raw post documents, loading all their authors with a single $in query.
+    """
+    author_ids = list({post['author'] for post in posts if post.get('author')})
+    authors = {}
+    if author_ids:
+        users = User.objects(id__in=author_ids).as_pymongo()
+        authors = {user['_id']: serialize_raw_user(user) for user in users}
+    return [serialize_raw_post(post, authors) for post in posts]
@@ -0,0 +1,23 @@
+def is_enabled(args: dict, name: str) -> bool:
+    """
+    Whether a boolean query parameter is set, e.g. ?stream=true or ?raw=1.
+    """
+    return args.get(name, '').lower() in ('1', 'true')
+
+
+def tag_filter(args) -> dict:
+    """
+    The Mongo filter of the posts carrying the tags given as ?tag=a&tag=b: all of them with
+    ?mode=all (the default), any of them with ?mode=any. Empty when no tag is given.
+
+    Either form is served by the (_cls, tags, _id) index of Post.
+    """
+    tags = [tag for tag in args.getlist('tag') if tag]
+    mode = args.get('mode', 'all')
+    if mode not in ('all', 'any'):
+        raise Exception('Invalid mode')
+    if not tags:
+        return {}
+    if len(tags) == 1:
+        return {'tags': tags[0]}
+    return {'tags': {'$all' if mode == 'all' else '$in': tags}}
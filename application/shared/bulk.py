@@ -0,0 +1,75 @@
+from pymongo.errors import BulkWriteError
+from application.shared.constants import MAX_BULK_SIZE
+
+
+def parse_items(data) -> list:
+    """
+    Check that a bulk request body is a list of at most MAX_BULK_SIZE objects.
+    """
+    if not isinstance(data, list):
+        raise Exception('Expected a list of items')
+    if len(data) > MAX_BULK_SIZE:
+        raise Exception(f'At most {MAX_BULK_SIZE} items can be created at once')
+    return data
+
+
+def insert_many(document, documents: list) -> list:
+    """
+    Insert documents into the collection of a document class with a single unordered
+    insert_many, so one failing document does not stop the others.
+
+    Returns one error message per document, None for the documents that were inserted.
+    Inserted documents get their id set.
+    """
+    if not documents:
+        return []
+
+    sons = [instance.to_mongo() for instance in documents]
+    errors = [None] * len(documents)
+    try:
+        document._get_collection().insert_many(sons, ordered=False)
+    except BulkWriteError as e:
+        for error in e.details['writeErrors']:
+            errors[error['index']] = error['errmsg']
+
+    for instance, son, error in zip(documents, sons, errors):
+        if error is None:
+            instance.id = son['_id']
+    return errors
+
+
+def bulk_create(document, items: list, build) -> list:
+    """
+    Build a document from every item with build(item), insert the valid ones with one
+    unordered insert_many and return one result per item, in the order of the items.
+
+    build raises an exception for an invalid item; it is reported in that item's result.
+    """
+    results = [None] * len(items)
+    documents, positions = [], []
+    for index, item in enumerate(items):
+        try:
+            if not isinstance(item, dict):
+                raise Exception('Expected an object')
+            instance = build(item)
+            instance.validate()
+        except Exception as e:
+            results[index] = {'message': str(e), 'status': 'error'}
+            continue
+        documents.append(instance)
+        positions.append(index)
+
+    for index, instance, error in zip(positions, documents, insert_many(document, documents)):
+        if error is None:
+            results[index] = {'id': str(instance.id), 'status': 'success'}
+        else:
+            results[index] = {'message': error, 'status': 'error'}
+    return results
+
+
+def summary(results: list) -> dict:
+    """
+    Count the created and failed items of bulk_create results.
+    """
+    created = sum(1 for result in results if result['status'] == 'success')
+    return {'created': created, 'failed': len(results) - created}
@@ -0,0 +1,200 @@
+import logging
+from collections import Counter, OrderedDict
+from queue import Queue, Empty, Full
+from threading import Event, Lock, Thread
+from time import monotonic
+from pymongo import UpdateOne, WriteConcern
+from pymongo.errors import BulkWriteError
+from application.models.post import Post
+from application.models.post_comment import PostComment
+from application.models.collection_version import CollectionVersion
+from application.models.stat import Stat
+from application.models.user import invalidate_author_pages
+from application.shared.constants import RECENT_COMMENTS
+
+logger = logging.getLogger(__name__)
+
+
+class CommentQueue:
+    """
+    Write-behind queue of comments: the add comment view only enqueues, and a background
+    thread writes the comments every interval seconds or batch_size comments, whichever
+    comes first. The comments of a batch are coalesced per post into one $push/$inc update
+    each, sent as a single bulk_write, plus one insert_many into the comment collection.
+
+    The queue holds at most maxsize comments; put() waits up to put_timeout seconds for
+    room and then fails, pushing back on clients instead of growing without bound.
+    Comments still queued at exit are written by stop(), registered with atexit. Comments
+    on posts that do not exist any more when their batch is written are dropped.
+    """
+
+    def __init__(self, maxsize: int, batch_size: int, interval: float, put_timeout: float,
+                 write_concern: dict = None):
+        self.batch_size = batch_size
+        self.interval = interval
+        self.put_timeout = put_timeout
+        self.write_concern = WriteConcern(**(write_concern or {}))
+        self.written = 0
+        self.dropped = 0
+        self.rejected = 0
+        self._queue = Queue(maxsize)
+        self._stopping = Event()
+        self._thread = None
+        self._lock = Lock()
+
+    def put(self, post_id, comment):
+        """
+        Enqueue a validated comment for the post with the given ObjectId.
+        """
+        self._ensure_started()
+        try:
+            self._queue.put((post_id, comment), timeout=self.put_timeout)
+        except Full:
+            self.rejected += 1
+            raise Exception('Too many comments are waiting to be written, try again later')
+
+    def _ensure_started(self):
+        # started on first use rather than at app creation so that every worker process
+        # of a preforking server runs its own flusher
+        if self._thread is None or not self._thread.is_alive():
+            with self._lock:
+                if self._thread is None or not self._thread.is_alive():
+                    self._stopping.clear()
+                    self._thread = Thread(target=self._run, name='comment-queue', daemon=True)
+                    self._thread.start()
+
+    def _run(self):
+        while not self._stopping.is_set():
+            try:
+                items = [self._queue.get(timeout=self.interval)]
+            except Empty:
+                continue
+            deadline = monotonic() + self.interval
+            while len(items) < self.batch_size:
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    items.append(self._queue.get(timeout=remaining))
+                except Empty:
+                    break
+            self._write(items)
+
+    def flush(self):
+        """
+        Write every queued comment now, in batches of batch_size.
+        """
+        while True:
+            items = []
+            try:
+                while len(items) < self.batch_size:
+                    items.append(self._queue.get_nowait())
+            except Empty:
+                pass
+            if not items:
+                return
+            self._write(items)
+
+    def stop(self):
+        """
+        Stop the flusher thread and write the comments still queued.
+        """
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval * 2)
+        self.flush()
+
+    def stats(self) -> dict:
+        return {
+            'queued': self._queue.qsize(),
+            'written': self.written,
+            'dropped': self.dropped,
+            'rejected': self.rejected
+        }
+
+    def _write(self, items: list):
+        try:
+            self._write_batch(items)
+        except Exception:
+            self.dropped += len(items)
+            logger.exception('Failed to write a batch of %d comments', len(items))
+
+    def _drop(self, comments: OrderedDict, dropped: list):
+        """
+        Remove (post id, comment) pairs from the comments of a batch grouped per post.
+        """
+        for post_id, comment in dropped:
+            comments[post_id].remove(comment)
+            if not comments[post_id]:
+                del comments[post_id]
+        self.dropped += len(dropped)
+
+    def _write_batch(self, items: list):
+        comments = OrderedDict()
+        for post_id, comment in items:
+            comments.setdefault(post_id, []).append(comment)
+
+        posts = {
+            post['_id']: Post._from_son(post) for post in Post._get_collection().find(
+                {'_id': {'$in': list(comments)}}, {'_cls': 1, 'author': 1, 'tags': 1}
+            )
+        }
+        for post_id in [post_id for post_id in comments if post_id not in posts]:
+            missing = comments.pop(post_id)
+            self.dropped += len(missing)
+            logger.warning('Dropped %d comments on missing post %s', len(missing), post_id)
+        if not comments:
+            return
+
+        # the comments are stored before the posts embed and count them, as in the add
+        # comment view; comments that could not be stored are left out of the post updates
+        stored = [
+            (post_id, comment) for post_id, post_comments in comments.items() for comment in post_comments
+        ]
+        try:
+            PostComment._get_collection().with_options(write_concern=self.write_concern).insert_many([
+                PostComment(
+                    id=comment.id, post=post_id, content=comment.content, name=comment.name
+                ).to_mongo()
+                for post_id, comment in stored
+            ], ordered=False)
+        except BulkWriteError as e:
+            failed = {error['index'] for error in e.details['writeErrors']}
+            logger.error('Failed to store %d queued comments: %s', len(failed), e)
+            self._drop(comments, [stored[index] for index in failed])
+        if not comments:
+            return
+
+        # with an unordered bulk write the other updates are applied when some fail; the
+        # comments of the posts that could not be updated are deleted again
+        updated = list(comments)
+        try:
+            Post._get_collection().with_options(write_concern=self.write_concern).bulk_write([
+                UpdateOne({'_id': post_id}, {
+                    '$push': {'comments': {
+                        '$each': [comment.to_mongo() for comment in comments[post_id]],
+                        '$slice': -RECENT_COMMENTS
+                    }},
+                    '$inc': {'comment_count': len(comments[post_id])}
+                })
+                for post_id in updated
+            ], ordered=False)
+        except BulkWriteError as e:
+            failed = [updated[error['index']] for error in e.details['writeErrors']]
+            logger.error('Failed to update %d posts with queued comments: %s', len(failed), e)
+            dropped = [(post_id, comment) for post_id in failed for comment in comments[post_id]]
+            PostComment._get_collection().with_options(write_concern=self.write_concern).delete_many({
+                '_id': {'$in': [comment.id for _, comment in dropped]}
+            })
+            self._drop(comments, dropped)
+        if not comments:
+            return
+
+        counts = Counter()
+        for post_id, post_comments in comments.items():
+            counts.update(dict.fromkeys(Stat.keys(posts[post_id]), len(post_comments)))
+
+        CollectionVersion.bump('post')
+        invalidate_author_pages(*{posts[post_id].author_id for post_id in comments})
+        Stat.increment(Counter(), counts)
+        self.written += sum(len(post_comments) for post_comments in comments.values())
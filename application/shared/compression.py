@@ -0,0 +1,97 @@
+import zlib
+from flask import current_app, request, Response
+from application.shared.constants import COMPRESSION_MIN_SIZE
+
+try:
+    import brotli
+except ImportError:  # br is only offered when brotli is installed
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # zstd is only offered when zstandard is installed
+    zstandard = None
+
+
+def available_encodings() -> list:
+    """
+    The content encodings responses can be compressed with, in order of preference.
+    """
+    return [
+        encoding for encoding, available in [('zstd', zstandard), ('br', brotli), ('gzip', zlib)]
+        if available
+    ]
+
+
+def negotiate_encoding(accept_encodings):
+    """
+    Pick the content encoding from the Accept-Encoding header, None when the client accepts none.
+    """
+    return accept_encodings.best_match(available_encodings())
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == 'zstd':
+        return zstandard.ZstdCompressor().compress(body)
+    if encoding == 'br':
+        return brotli.compress(body)
+    return zlib.compress(body, wbits=31)  # 31: gzip container
+
+
+def compress_stream(chunks, encoding: str):
+    """
+    Compress an iterable of byte chunks, flushing after every chunk so that each one still
+    reaches the client as soon as it is produced.
+    """
+    if encoding == 'br':
+        compressor = brotli.Compressor()
+        for chunk in chunks:
+            if chunk:
+                yield compressor.process(chunk) + compressor.flush()
+        yield compressor.finish()
+        return
+
+    if encoding == 'zstd':
+        compressor = zstandard.ZstdCompressor().compressobj()
+        flush_mode = zstandard.COMPRESSOBJ_FLUSH_BLOCK
+    else:
+        compressor = zlib.compressobj(wbits=31)
+        flush_mode = zlib.Z_SYNC_FLUSH
+    for chunk in chunks:
+        if chunk:
+            yield compressor.compress(chunk) + compressor.flush(flush_mode)
+    yield compressor.flush()
+
+
+def compress_response(response: Response) -> Response:
+    """
+    after_request hook compressing responses with the encoding negotiated from Accept-Encoding.
+
+    Regular responses are compressed when they are at least COMPRESSION_MIN_SIZE bytes
+    (configurable); streamed responses are compressed chunk by chunk whatever their size.
+    Responses that already have a Content-Encoding, e.g. compressed cache entries, are
+    left untouched.
+    """
+    response.vary.add('Accept-Encoding')
+    if (
+        response.direct_passthrough
+        or 'Content-Encoding' in response.headers
+        or response.status_code < 200
+        or response.status_code in (204, 304)
+    ):
+        return response
+
+    encoding = negotiate_encoding(request.accept_encodings)
+    if encoding is None:
+        return response
+
+    if response.is_streamed:
+        response.response = compress_stream(response.iter_encoded(), encoding)
+        response.headers.pop('Content-Length', None)
+    else:
+        min_size = current_app.config.get('COMPRESSION_MIN_SIZE', COMPRESSION_MIN_SIZE)
+        if response.content_length is None or response.content_length < min_size:
+            return response
+        response.set_data(compress(response.get_data(), encoding))
+    response.headers['Content-Encoding'] = encoding
+    return response
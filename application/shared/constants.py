@@ -1 +1,22 @@
-POST_TYPES = ['text', 'image', 'link']
\ No newline at end of file
+POST_TYPES = ['text', 'image', 'link']
+DEFAULT_PAGE_LIMIT = 20
+MAX_PAGE_LIMIT = 100
+STREAM_BATCH_SIZE = 500
+MAX_STREAM_BATCH_SIZE = 5000
+LIST_EXCLUDED_FIELDS = ['comments']
+MAX_BULK_SIZE = 10000
+USER_CACHE_SIZE = 10000
+USER_CACHE_TTL = 300
+RESPONSE_CACHE_SIZE = 1000
+RESPONSE_CACHE_TTL = 300
+RECENT_COMMENTS = 3
+COMPRESSION_MIN_SIZE = 1024
+QUERY_REPEAT_THRESHOLD = 3
+AUTHOR_PAGE_CACHE_SIZE = 10000
+AUTHOR_PAGE_CACHE_TTL = 60
+COMMENT_QUEUE_SIZE = 10000
+COMMENT_QUEUE_BATCH_SIZE = 1000
+COMMENT_QUEUE_INTERVAL = 0.5
+COMMENT_QUEUE_PUT_TIMEOUT = 1.0
+VERSION_POLL_SIZE = 100000
+VERSION_POLL_INTERVAL = 1.0
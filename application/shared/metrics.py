@@ -0,0 +1,191 @@
+from bisect import bisect_left
+from threading import Lock
+from time import perf_counter
+from flask import g, request, Response
+
+REQUEST_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+RESPONSE_SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+COMMAND_LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1)
+# connection pool statistics exposed as gauges, with their descriptions
+POOL_GAUGES = {
+    'open': 'Open connections by server.',
+    'checked_out': 'Connections checked out by server.',
+    'max_checked_out': 'Most connections checked out at once by server.'
+}
+
+
+def _labels(names: tuple, values: tuple) -> str:
+    if not names:
+        return ''
+    pairs = ','.join(
+        '%s="%s"' % (name, str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for name, value in zip(names, values)
+    )
+    return '{%s}' % pairs
+
+
+class Counter:
+    """
+    A Prometheus counter with labels; one lock-protected float per label combination.
+    """
+
+    def __init__(self, name: str, description: str, labels: tuple = ()):
+        self.name = name
+        self.description = description
+        self.labels = labels
+        self._values = {}
+        self._lock = Lock()
+
+    def inc(self, *labels, amount: float = 1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self) -> list:
+        lines = [f'# HELP {self.name} {self.description}', f'# TYPE {self.name} counter']
+        with self._lock:
+            for labels, value in sorted(self._values.items()):
+                lines.append(f'{self.name}{_labels(self.labels, labels)} {value}')
+        return lines
+
+
+class Histogram:
+    """
+    A Prometheus histogram with labels. Observations only bump one bucket; the cumulative
+    bucket counts are computed when rendering.
+    """
+
+    def __init__(self, name: str, description: str, buckets: tuple, labels: tuple = ()):
+        self.name = name
+        self.description = description
+        self.buckets = buckets
+        self.labels = labels
+        # per label combination: [count per bucket (+Inf last), sum]
+        self._values = {}
+        self._lock = Lock()
+
+    def observe(self, value: float, *labels):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._values.get(labels)
+            if counts is None:
+                counts = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            counts[0][index] += 1
+            counts[1] += value
+
+    def render(self) -> list:
+        lines = [f'# HELP {self.name} {self.description}', f'# TYPE {self.name} histogram']
+        names = self.labels + ('le',)
+        with self._lock:
+            for labels, (counts, total) in sorted(self._values.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets + ('+Inf',), counts):
+                    cumulative += count
+                    lines.append(f'{self.name}_bucket{_labels(names, labels + (bound,))} {cumulative}')
+                lines.append(f'{self.name}_sum{_labels(self.labels, labels)} {total}')
+                lines.append(f'{self.name}_count{_labels(self.labels, labels)} {cumulative}')
+        return lines
+
+
+def render_samples(name: str, description: str, kind: str, labels: tuple, samples: list) -> list:
+    """
+    Render a metric of the given kind read at scrape time from (label values, value) samples.
+    """
+    lines = [f'# HELP {name} {description}', f'# TYPE {name} {kind}']
+    for values, value in samples:
+        lines.append(f'{name}{_labels(labels, values)} {value}')
+    return lines
+
+
+http_requests = Counter(
+    'http_requests_total', 'HTTP requests by route, method and status.', ('route', 'method', 'status')
+)
+http_request_duration = Histogram(
+    'http_request_duration_seconds', 'HTTP request latency by route, until the response is returned.',
+    REQUEST_LATENCY_BUCKETS, ('route', 'method')
+)
+http_response_size = Histogram(
+    'http_response_size_bytes', 'HTTP response body size by route, as sent.',
+    RESPONSE_SIZE_BUCKETS, ('route', 'method')
+)
+mongo_commands = Counter(
+    'mongo_commands_total', 'Mongo commands by collection, command and outcome.',
+    ('collection', 'command', 'outcome')
+)
+mongo_command_duration = Histogram(
+    'mongo_command_duration_seconds', 'Mongo command latency by collection and command.',
+    COMMAND_LATENCY_BUCKETS, ('collection', 'command')
+)
+
+
+def _route() -> str:
+    return request.url_rule.rule if request.url_rule else 'unmatched'
+
+
+def start_timer():
+    """
+    before_request hook starting the latency timer of the request.
+    """
+    g.request_start = perf_counter()
+
+
+def _count_bytes(chunks, route: str, method: str):
+    size = 0
+    for chunk in chunks:
+        size += len(chunk)
+        yield chunk
+    http_response_size.observe(size, route, method)
+
+
+def record_request(response: Response) -> Response:
+    """
+    after_request hook recording the count, latency and size of the request. Streamed
+    responses without a Content-Length are sized once their last chunk has been produced.
+    """
+    start = g.pop('request_start', None)
+    if start is None:
+        return response
+    route, method = _route(), request.method
+    http_requests.inc(route, method, response.status_code)
+    http_request_duration.observe(perf_counter() - start, route, method)
+    if response.content_length is not None:
+        http_response_size.observe(response.content_length, route, method)
+    elif response.is_streamed:
+        response.response = _count_bytes(response.iter_encoded(), route, method)
+    else:
+        http_response_size.observe(len(response.get_data()), route, method)
+    return response
+
+
+def render_metrics() -> str:
+    """
+    All the metrics of this process in the Prometheus text exposition format.
+    """
+    from application.models.user import user_cache
+    from application.shared.monitoring import pool_stats
+
+    lines = []
+    metrics = (
+        http_requests, http_request_duration, http_response_size, mongo_commands, mongo_command_duration
+    )
+    for metric in metrics:
+        lines += metric.render()
+
+    cache = user_cache.stats()
+    lines += render_samples('user_cache_entries', 'Users in the email to user cache.', 'gauge', (), [
+        ((), cache['size'])
+    ])
+    lines += render_samples(
+        'user_cache_lookups_total', 'User cache lookups by result.', 'counter', ('result',),
+        [(('hit',), cache['hits']), (('miss',), cache['misses'])]
+    )
+
+    pools = sorted(pool_stats.stats().items())
+    for name, description in POOL_GAUGES.items():
+        lines += render_samples(f'mongo_pool_{name}', description, 'gauge', ('address',), [
+            ((address,), stats[name]) for address, stats in pools
+        ])
+    lines += render_samples(
+        'mongo_pool_checkout_failures_total', 'Failed connection checkouts by server.', 'counter',
+        ('address',), [((address,), stats['checkout_failures']) for address, stats in pools]
+    )
+    return '\n'.join(lines) + '\n'
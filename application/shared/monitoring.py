@@ -0,0 +1,102 @@
+from collections import defaultdict
+from threading import Lock
+from pymongo import monitoring
+from application.shared.metrics import mongo_commands, mongo_command_duration
+
+
+class PoolStatsListener(monitoring.ConnectionPoolListener):
+    """
+    Connection pool listener keeping counters per server, to size the number of workers
+    against maxPoolSize: connections open and checked out, checkouts that failed (e.g.
+    waitQueueTimeoutMS exceeded), and the peak number of connections checked out at once.
+    """
+
+    def __init__(self):
+        self._stats = defaultdict(lambda: {
+            'open': 0,
+            'checked_out': 0,
+            'max_checked_out': 0,
+            'created': 0,
+            'closed': 0,
+            'checkouts': 0,
+            'checkout_failures': 0,
+            'pool_clears': 0
+        })
+        self._lock = Lock()
+
+    def _update(self, event, **increments):
+        with self._lock:
+            stats = self._stats['%s:%s' % event.address]
+            for name, increment in increments.items():
+                stats[name] += increment
+            stats['max_checked_out'] = max(stats['max_checked_out'], stats['checked_out'])
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {address: dict(stats) for address, stats in self._stats.items()}
+
+    def pool_created(self, event):
+        self._update(event)
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        self._update(event, pool_clears=1)
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        self._update(event, open=1, created=1)
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        self._update(event, open=-1, closed=1)
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def connection_check_out_failed(self, event):
+        self._update(event, checkout_failures=1)
+
+    def connection_checked_out(self, event):
+        self._update(event, checked_out=1, checkouts=1)
+
+    def connection_checked_in(self, event):
+        self._update(event, checked_out=-1)
+
+
+class CommandMetricsListener(monitoring.CommandListener):
+    """
+    Command listener feeding the Mongo command metrics. Only the started event names the
+    collection, so it is kept by request id until the command completes.
+    """
+
+    def __init__(self):
+        self._collections = {}
+
+    def started(self, event):
+        collection = event.command.get(event.command_name)
+        if event.command_name == 'getMore':
+            collection = event.command.get('collection')
+        self._collections[(event.connection_id, event.request_id)] = (
+            collection if isinstance(collection, str) else ''
+        )
+
+    def _record(self, event, outcome: str):
+        collection = self._collections.pop((event.connection_id, event.request_id), '')
+        mongo_commands.inc(collection, event.command_name, outcome)
+        mongo_command_duration.observe(event.duration_micros / 1e6, collection, event.command_name)
+
+    def succeeded(self, event):
+        self._record(event, 'success')
+
+    def failed(self, event):
+        self._record(event, 'failure')
+
+
+pool_stats = PoolStatsListener()
+command_metrics = CommandMetricsListener()
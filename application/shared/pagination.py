@@ -0,0 +1,116 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from json import dumps, loads
+from bson import ObjectId
+from application.shared.constants import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT
+
+
+def encode_cursor(**values) -> str:
+    """
+    Encode the sort key of the last document of a page into an opaque cursor.
+    """
+    return urlsafe_b64encode(dumps(values, default=str).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> dict:
+    """
+    Decode a cursor produced by encode_cursor back into its sort key values.
+    """
+    try:
+        values = loads(urlsafe_b64decode(cursor.encode()))
+        if not isinstance(values, dict):
+            raise ValueError(cursor)
+        return values
+    except (ValueError, TypeError):
+        raise Exception('Invalid cursor')
+
+
+def cursor_object_id(value) -> ObjectId:
+    """
+    The ObjectId of an id decoded from a cursor, which must be its string form: a missing
+    id must not reach ObjectId(None), which would generate a new id instead of failing.
+    """
+    if not isinstance(value, str) or not ObjectId.is_valid(value):
+        raise Exception('Invalid cursor')
+    return ObjectId(value)
+
+
+def parse_limit(limit) -> int:
+    """
+    Parse the requested page size, defaulting to DEFAULT_PAGE_LIMIT and capping at MAX_PAGE_LIMIT.
+    """
+    if limit is None:
+        return DEFAULT_PAGE_LIMIT
+    try:
+        limit = int(limit)
+    except ValueError:
+        raise Exception('Invalid limit')
+    if limit < 1:
+        raise Exception('Invalid limit')
+    return min(limit, MAX_PAGE_LIMIT)
+
+
+def paginate(queryset, args: dict):
+    """
+    Return one page of a queryset using keyset pagination on _id (newest first).
+
+    The page starts strictly after the document encoded in args['after'], so every page
+    is an index seek on _id instead of a skip over all previous pages.
+
+    Works with document and as_pymongo() querysets alike.
+
+    Returns a tuple (documents, next_cursor); next_cursor is None on the last page.
+    """
+    limit = parse_limit(args.get('limit'))
+    after = args.get('after')
+    if after:
+        queryset = queryset.filter(id__lt=cursor_object_id(decode_cursor(after).get('id')))
+
+    documents = list(queryset.order_by('-id').limit(limit + 1))
+    next_cursor = None
+    if len(documents) > limit:
+        documents = documents[:limit]
+        last = documents[-1]
+        next_cursor = encode_cursor(id=last['_id'] if isinstance(last, dict) else last.id)
+    return documents, next_cursor
+
+
+def paginate_search(queryset, args: dict, projection: dict = None):
+    """
+    Return one page of a $text search queryset, most relevant first, as raw documents
+    carrying their text score in 'score'.
+
+    Pages are keyed on (score, _id) like paginate() is on _id: the next page starts
+    strictly after the last document of the previous one in that order. The queryset's
+    filter, including its $text, becomes the first $match of the aggregation as $text
+    requires.
+
+    Returns a tuple (documents, next_cursor); next_cursor is None on the last page.
+    """
+    limit = parse_limit(args.get('limit'))
+    pipeline = [{'$addFields': {'score': {'$meta': 'textScore'}}}]
+
+    after = args.get('after')
+    if after:
+        values = decode_cursor(after)
+        last_id = cursor_object_id(values.get('id'))
+        try:
+            score = float(values['score'])
+        except (KeyError, TypeError, ValueError):
+            raise Exception('Invalid cursor')
+        pipeline.append({'$match': {'$or': [
+            {'score': {'$lt': score}},
+            {'score': score, '_id': {'$lt': last_id}}
+        ]}})
+
+    pipeline += [{'$sort': {'score': -1, '_id': -1}}, {'$limit': limit + 1}]
+    if projection:
+        if 1 in projection.values():
+            projection = {**projection, 'score': 1}
+        pipeline.append({'$project': projection})
+
+    documents = list(queryset.aggregate(pipeline))
+    next_cursor = None
+    if len(documents) > limit:
+        documents = documents[:limit]
+        next_cursor = encode_cursor(score=documents[-1]['score'], id=documents[-1]['_id'])
+    return documents, next_cursor
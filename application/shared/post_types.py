@@ -0,0 +1,17 @@
+from application.models.text_post import TextPost
+from application.models.image_post import ImagePost
+from application.models.link_post import LinkPost
+
+# the document class of each post type, by the name used in the URLs
+POST_DOCUMENTS = {
+    'text': TextPost,
+    'image': ImagePost,
+    'link': LinkPost
+}
+
+# the field each post type adds on top of Post
+POST_TYPE_FIELDS = {
+    TextPost: 'content',
+    ImagePost: 'image_path',
+    LinkPost: 'link_url'
+}
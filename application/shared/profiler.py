@@ -0,0 +1,158 @@
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from flask import current_app, g, request, Response
+from pymongo import monitoring
+from application.shared.constants import QUERY_REPEAT_THRESHOLD
+
+# the recorders collecting the commands of the current request or query_budget() block
+_recorders: ContextVar = ContextVar('query_recorders', default=())
+
+# command fields that vary between otherwise identical commands
+VOLATILE_FIELDS = {
+    'lsid', '$db', '$clusterTime', '$readPreference', 'txnNumber', 'readConcern', 'writeConcern'
+}
+
+
+def _shape(value):
+    if isinstance(value, dict):
+        return {key: _shape(item) for key, item in sorted(value.items())}
+    if isinstance(value, (list, tuple)):
+        shapes = []
+        for item in value:
+            shape = _shape(item)
+            if shape not in shapes:
+                shapes.append(shape)
+        return shapes
+    return '?'
+
+
+def query_shape(event) -> str:
+    """
+    The shape of a command: its name, collection and structure with every value replaced
+    by '?', so that the same query run for different documents has the same shape.
+    """
+    fields = {
+        key: value for key, value in event.command.items()
+        if key != event.command_name and key not in VOLATILE_FIELDS
+    }
+    return f'{event.command_name} {event.command.get(event.command_name)} {_shape(fields)}'
+
+
+class QueryRecorder:
+    """
+    The Mongo commands issued while the recorder is active, with their shapes and durations.
+    """
+
+    def __init__(self):
+        self.queries = []
+        self._pending = {}
+
+    @property
+    def count(self) -> int:
+        return len(self.queries)
+
+    @property
+    def duration(self) -> float:
+        return sum(duration for _, duration in self.queries)
+
+    def started(self, event):
+        self._pending[(event.connection_id, event.request_id)] = query_shape(event)
+
+    def finished(self, event):
+        shape = self._pending.pop((event.connection_id, event.request_id), None)
+        if shape is not None:
+            self.queries.append((shape, event.duration_micros / 1e6))
+
+    def repeated(self, threshold: int = QUERY_REPEAT_THRESHOLD) -> dict:
+        """
+        The shapes issued at least threshold times, likely N+1 queries, with their counts.
+        """
+        counts = Counter(shape for shape, _ in self.queries)
+        return {shape: count for shape, count in counts.items() if count >= threshold}
+
+
+class ProfilerListener(monitoring.CommandListener):
+    """
+    Command listener passing every command to the recorders active in the current context.
+    Commands are published on the thread that runs them, so a request only sees its own.
+    """
+
+    def started(self, event):
+        for recorder in _recorders.get():
+            recorder.started(event)
+
+    def succeeded(self, event):
+        for recorder in _recorders.get():
+            recorder.finished(event)
+
+    def failed(self, event):
+        for recorder in _recorders.get():
+            recorder.finished(event)
+
+
+profiler = ProfilerListener()
+
+
+@contextmanager
+def recording():
+    """
+    Record the Mongo commands issued within the block.
+    """
+    recorder = QueryRecorder()
+    token = _recorders.set(_recorders.get() + (recorder,))
+    try:
+        yield recorder
+    finally:
+        _recorders.reset(token)
+
+
+@contextmanager
+def query_budget(max_queries: int):
+    """
+    Fail with an AssertionError when the block issues more than max_queries Mongo commands,
+    e.g. in a test:
+
+        with query_budget(3):
+            client.get('/post/list')
+    """
+    with recording() as recorder:
+        yield recorder
+    if recorder.count > max_queries:
+        counts = Counter(shape for shape, _ in recorder.queries)
+        shapes = '\n'.join(f'{count} x {shape}' for shape, count in counts.items())
+        raise AssertionError(f'{recorder.count} queries issued, budget is {max_queries}:\n{shapes}')
+
+
+def start_profiling():
+    """
+    before_request hook recording the commands of the request when QUERY_PROFILER is set.
+    """
+    if current_app.config.get('QUERY_PROFILER'):
+        g.query_recorder = QueryRecorder()
+        g.query_recorder_token = _recorders.set(_recorders.get() + (g.query_recorder,))
+
+
+def report_profile(response: Response) -> Response:
+    """
+    after_request hook adding the number and total time of the commands of the request as
+    headers, and logging the shapes repeated often enough to be N+1 queries. The commands
+    of a streamed response issued after the first chunk are not counted.
+    """
+    recorder = g.get('query_recorder')
+    if recorder is None:
+        return response
+    response.headers['X-DB-Query-Count'] = str(recorder.count)
+    response.headers['X-DB-Query-Time-Ms'] = f'{recorder.duration * 1000:.3f}'
+    for shape, count in recorder.repeated().items():
+        current_app.logger.warning('Possible N+1 query in %s: %d x %s', request.path, count, shape)
+    return response
+
+
+def stop_profiling(exception=None):
+    """
+    teardown_request hook deactivating the recorder of the request.
+    """
+    token = g.pop('query_recorder_token', None)
+    if token is not None:
+        _recorders.reset(token)
@@ -0,0 +1,62 @@
+from mongoengine.base import get_document
+
+
+def document_fields(document) -> set:
+    """
+    Names of the fields a client may request for a document class, including the
+    fields declared by its subclasses.
+    """
+    fields = set()
+    for name in document._subclasses:
+        fields.update(get_document(name)._fields)
+    return {field for field in fields if not field.startswith('_') and field != 'id'}
+
+
+class Projection:
+    """
+    A sparse fieldset requested with ?fields=a,b,c, applied both to the Mongo query
+    (so unrequested fields never leave the database) and to the serialized documents.
+
+    Without ?fields=, every field except the excluded ones is returned.
+    """
+
+    def __init__(self, fields: str, document, exclude: list = None):
+        self.document = document
+        self.exclude = [] if fields else list(exclude or [])
+        self.fields = None
+        if fields:
+            allowed = document_fields(document)
+            self.fields = [field.strip() for field in fields.split(',') if field.strip()]
+            for field in self.fields:
+                if field not in allowed:
+                    raise Exception(f'Invalid field: {field}')
+
+    def apply(self, queryset):
+        if self.fields:
+            return queryset.only(*self.fields)
+        if self.exclude:
+            return queryset.exclude(*self.exclude)
+        return queryset
+
+    def to_mongo(self):
+        """
+        The projection as a Mongo projection document, for queries that bypass mongoengine;
+        None when every field is returned. _cls is always kept to serialize by post type.
+        """
+        if self.fields:
+            return {'_cls': 1, **{self._db_field(field): 1 for field in self.fields}}
+        if self.exclude:
+            return {self._db_field(field): 0 for field in self.exclude}
+        return None
+
+    def _db_field(self, name: str) -> str:
+        for class_name in self.document._subclasses:
+            field = get_document(class_name)._fields.get(name)
+            if field is not None:
+                return field.db_field
+        return name
+
+    def select(self, document: dict) -> dict:
+        if self.fields:
+            return {key: value for key, value in document.items() if key == 'id' or key in self.fields}
+        return {key: value for key, value in document.items() if key not in self.exclude}
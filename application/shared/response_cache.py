@@ -0,0 +1,65 @@
+from functools import wraps
+from hashlib import sha1
+from flask import request, Response
+from application.models.collection_version import CollectionVersion
+from application.shared.cache import LRUCache
+from application.shared.compression import compress_response, negotiate_encoding
+from application.shared.responses import negotiate
+from application.shared.routing import lists_read_primary
+from application.shared.constants import RESPONSE_CACHE_SIZE, RESPONSE_CACHE_TTL
+from application.shared.streaming import is_streaming
+
+response_cache = LRUCache(RESPONSE_CACHE_SIZE, RESPONSE_CACHE_TTL)
+
+
+def cached_response(*collections: str):
+    """
+    Cache the successful responses of a GET view per URL and answer conditional requests.
+
+    The ETag of a response is derived from the URL, the negotiated mimetype and the current
+    CollectionVersion of every collection the view reads, so it changes as soon as a view
+    writing to one of those collections bumps its version. Until then, requests with a matching
+    If-None-Match get 304 Not Modified and other requests get the cached body, both
+    without running the view. Streamed responses are never cached.
+
+    Bodies are cached per content encoding, already compressed, so cache hits are not
+    compressed again.
+
+    The versions are read on the primary, so responses are only cached when the view reads
+    there too: with a LIST_READ_PREFERENCE other than 'primary', a lagging secondary could
+    return data older than the versions, which would then be served under them.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if is_streaming(request.args) or not lists_read_primary():
+                return view(*args, **kwargs)
+
+            mimetype = negotiate(request.accept_mimetypes)
+            encoding = negotiate_encoding(request.accept_encodings)
+            versions = CollectionVersion.current(list(collections))
+            etag = sha1(
+                f'{request.full_path}|{mimetype}|{encoding}|{sorted(versions.items())}'.encode()
+            ).hexdigest()
+
+            if request.if_none_match.contains(etag):
+                response = Response(status=304)
+            else:
+                cached = response_cache.get(etag)
+                if cached is None:
+                    response = view(*args, **kwargs)
+                    if response.status_code != 200:
+                        return response
+                    compress_response(response)
+                    content_encoding = response.headers.get('Content-Encoding')
+                    response_cache.set(etag, (response.get_data(), content_encoding))
+                else:
+                    body, content_encoding = cached
+                    response = Response(response=body, status=200, mimetype=mimetype)
+                    if content_encoding:
+                        response.headers['Content-Encoding'] = content_encoding
+            response.set_etag(etag)
+            response.vary.add('Accept')
+            return response
+        return wrapper
+    return decorator
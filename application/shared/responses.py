@@ -0,0 +1,47 @@
+from json import dumps
+import bson
+from flask import request, Response
+
+try:
+    import msgpack
+except ImportError:  # MessagePack responses are only offered when msgpack is installed
+    msgpack = None
+
+JSON = 'application/json'
+MSGPACK = 'application/msgpack'
+BSON = 'application/bson'
+
+
+def available_mimetypes() -> list:
+    """
+    The mimetypes responses can be encoded in, in order of preference; JSON is the default.
+    """
+    return [JSON, MSGPACK, BSON] if msgpack else [JSON, BSON]
+
+
+def negotiate(accept_mimetypes) -> str:
+    """
+    Pick the response mimetype from the Accept header, falling back to JSON.
+    """
+    return accept_mimetypes.best_match(available_mimetypes(), default=JSON)
+
+
+def encode(payload: dict, mimetype: str):
+    if mimetype == MSGPACK:
+        return msgpack.packb(payload)
+    if mimetype == BSON:
+        return bson.encode(payload)
+    return dumps(payload)
+
+
+def build_response(payload: dict) -> Response:
+    """
+    Build the response of a view from its payload (message, data, status and status_code),
+    encoded as JSON, MessagePack or BSON depending on the Accept header of the request.
+    """
+    mimetype = negotiate(request.accept_mimetypes)
+    response = Response(
+        response=encode(payload, mimetype), status=payload['status_code'], mimetype=mimetype
+    )
+    response.vary.add('Accept')
+    return response
@@ -0,0 +1,47 @@
+from flask import current_app
+from pymongo import ReadPreference, WriteConcern
+
+READ_PREFERENCES = {
+    'primary': ReadPreference.PRIMARY,
+    'primaryPreferred': ReadPreference.PRIMARY_PREFERRED,
+    'secondary': ReadPreference.SECONDARY,
+    'secondaryPreferred': ReadPreference.SECONDARY_PREFERRED,
+    'nearest': ReadPreference.NEAREST
+}
+
+
+def list_read_preference():
+    """
+    The read preference of the list endpoints, from the LIST_READ_PREFERENCE config
+    (a mode name such as 'secondaryPreferred'), the primary by default.
+    """
+    return READ_PREFERENCES[current_app.config.get('LIST_READ_PREFERENCE', 'primary')]
+
+
+def lists_read_primary() -> bool:
+    """
+    Whether list reads go to the primary, i.e. always see the latest writes.
+    """
+    return list_read_preference() == ReadPreference.PRIMARY
+
+
+def for_lists(queryset):
+    """
+    Send the reads of a list queryset to the members chosen by LIST_READ_PREFERENCE.
+    """
+    return queryset.read_preference(list_read_preference())
+
+
+def comment_write_concern() -> dict:
+    """
+    The write concern of comment writes, from the COMMENT_WRITE_CONCERN config.
+    """
+    return current_app.config.get('COMMENT_WRITE_CONCERN', {})
+
+
+def comment_collection(document):
+    """
+    The collection of a document with the write concern of comment writes, for the
+    updates mongoengine querysets cannot run with a write concern of their own.
+    """
+    return document._get_collection().with_options(write_concern=WriteConcern(**comment_write_concern()))
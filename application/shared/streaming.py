@@ -0,0 +1,92 @@
+from itertools import islice
+from json import dumps
+from flask import request, Response, stream_with_context
+from application.shared.arguments import is_enabled
+from application.shared.constants import STREAM_BATCH_SIZE, MAX_STREAM_BATCH_SIZE
+from application.shared.responses import JSON, build_response
+
+
+def is_streaming(args: dict) -> bool:
+    """
+    Whether the client asked for a streamed response with ?stream=true.
+    """
+    return is_enabled(args, 'stream')
+
+
+def parse_batch_size(batch_size) -> int:
+    """
+    Parse the requested cursor batch size, defaulting to STREAM_BATCH_SIZE and capping at
+    MAX_STREAM_BATCH_SIZE.
+    """
+    if batch_size is None:
+        return STREAM_BATCH_SIZE
+    try:
+        batch_size = int(batch_size)
+    except ValueError:
+        raise Exception('Invalid batch size')
+    if batch_size < 1:
+        raise Exception('Invalid batch size')
+    return min(batch_size, MAX_STREAM_BATCH_SIZE)
+
+
+def serialize_documents(documents: list) -> list:
+    return [document.to_dict() for document in documents]
+
+
+def generate_json(key: str, message: str, queryset, batch_size: int, serialize=serialize_documents,
+                  projection=None):
+    """
+    Yield the usual response envelope as JSON text, writing the documents of the
+    queryset batch by batch as they come off the Mongo cursor.
+
+    serialize turns a batch of documents into a list of dicts, which lets it resolve
+    references for the whole batch at once. projection, when given, selects the
+    serialized fields of every document.
+
+    The status line has already been sent when the documents are read, so an error
+    raised mid-stream closes the envelope with status 'error' instead.
+    """
+    if projection:
+        queryset = projection.apply(queryset)
+    # iterate the queryset exactly once: QuerySetNoCache rewinds on every iter() call
+    documents = (document for document in queryset.no_cache().batch_size(batch_size))
+    yield '{"message": %s, %s: [' % (dumps(message), dumps(key))
+    separator = ''
+    try:
+        while True:
+            batch = list(islice(documents, batch_size))
+            if not batch:
+                break
+            serialized = serialize(batch)
+            if projection:
+                serialized = [projection.select(document) for document in serialized]
+            yield separator + ', '.join(dumps(document) for document in serialized)
+            separator = ', '
+        yield '], "status": "success", "status_code": 200}'
+    except Exception as e:
+        yield '], "error": %s, "status": "error", "status_code": 500}' % dumps(str(e))
+
+
+def stream_response(key: str, message: str, queryset, args: dict, serialize=serialize_documents,
+                    projection=None) -> Response:
+    """
+    Build a chunked JSON response streaming every document of the queryset.
+
+    Streamed responses are JSON only, as MessagePack and BSON documents start with their
+    length: a request whose Accept header does not allow JSON gets 406 Not Acceptable.
+    """
+    if request.accept_mimetypes and not request.accept_mimetypes.best_match([JSON]):
+        return build_response({
+            'message': 'Streamed responses are only available as application/json',
+            'status': 'error',
+            'status_code': 406
+        })
+
+    batch_size = parse_batch_size(args.get('batch_size'))
+    response = Response(
+        stream_with_context(generate_json(key, message, queryset, batch_size, serialize, projection)),
+        status=200,
+        mimetype=JSON
+    )
+    response.vary.add('Accept')
+    return response
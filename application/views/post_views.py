@@ -1,17 +1,97 @@
-from flask import Blueprint, request, Response
-from json import dumps
+from bson import ObjectId
+from collections import Counter
+from flask import Blueprint, current_app, request
+from pymongo import ReturnDocument
 from application.models.post import Post
 from application.models.text_post import TextPost
 from application.models.image_post import ImagePost
 from application.models.link_post import LinkPost
-from application.models.user import User
+from application.models.user import User, invalidate_author_pages
 from application.models.tag import Tag
 from application.models.comment import Comment
-from application.shared.constants import POST_TYPES
+from application.models.post_comment import PostComment
+from application.models.collection_version import CollectionVersion
+from application.models.stat import Stat
+from application.serializers.raw import serialize_raw_posts
+from application.shared.arguments import is_enabled, tag_filter
+from application.shared.bulk import parse_items, bulk_create, summary
+from application.shared.constants import POST_TYPES, LIST_EXCLUDED_FIELDS, RECENT_COMMENTS
+from application.shared.pagination import paginate, paginate_search
+from application.shared.post_types import POST_DOCUMENTS, POST_TYPE_FIELDS
+from application.shared.projection import Projection
+from application.shared.response_cache import cached_response
+from application.shared.routing import for_lists, comment_collection, comment_write_concern
+from application.shared.responses import build_response
+from application.shared.streaming import is_streaming, stream_response, serialize_documents
 
 post_blueprint = Blueprint('post_blueprint', __name__)
 
 
+def serialize_posts(posts: list) -> list:
+    return serialize_documents(Post.prefetch_authors(posts))
+
+
+def list_queryset(document, args: dict):
+    """
+    The queryset and batch serializer of a post list: raw BSON documents with ?raw=true,
+    which skips building mongoengine documents, mongoengine documents otherwise. Reads go
+    to the members chosen by LIST_READ_PREFERENCE. Posts are filtered by the ?tag= given.
+    """
+    queryset = for_lists(document.objects(__raw__=tag_filter(args)))
+    if is_enabled(args, 'raw'):
+        return queryset.as_pymongo(), serialize_raw_posts
+    return queryset, serialize_posts
+
+
+def update_post_comments(post_id: str, update: dict):
+    """
+    Apply a raw update to the comments of a post with the comment write concern and
+    return the updated post, or None when it does not exist.
+    """
+    son = comment_collection(Post).find_one_and_update(
+        {'_id': ObjectId(post_id)}, update, return_document=ReturnDocument.AFTER
+    )
+    return None if son is None else Post._from_son(son)
+
+
+def refill_recent_comments(post: Post) -> Post:
+    """
+    Embed older comments again after one of the embedded comments of a post was removed,
+    up to RECENT_COMMENTS. Every step is an atomic update of the embedded list, so that
+    comments added or removed meanwhile are neither lost nor embedded twice.
+    """
+    missing = min(RECENT_COMMENTS, post.comment_count) - len(post.comments)
+    if missing <= 0:
+        return post
+
+    older = PostComment.objects(post=post.id).order_by('-id').limit(missing)
+    if post.comments:
+        older = older.filter(id__lt=post.comments[0].id)
+    comments = [comment.to_comment().to_mongo() for comment in reversed(list(older))]
+    if not comments:
+        return post
+
+    son = comment_collection(Post).find_one_and_update(
+        {'_id': post.id, 'comments.id': {'$nin': [comment['id'] for comment in comments]}},
+        {'$push': {'comments': {'$each': comments, '$position': 0, '$slice': -RECENT_COMMENTS}}},
+        return_document=ReturnDocument.AFTER
+    )
+    return post if son is None else Post._from_son(son)
+
+
+def set_updates(document, values: dict) -> dict:
+    """
+    Build mongoengine set__ update arguments from field values, validating each value
+    against its field since atomic updates bypass Document.validate().
+    """
+    updates = {}
+    for field, value in values.items():
+        if value is not None:
+            document._fields[field].validate(value)
+        updates[f'set__{field}'] = value
+    return updates
+
+
 @post_blueprint.route('/post/create/<post_type>', methods=['POST'])
 def create_post(post_type: str):
     """
@@ -53,22 +133,27 @@ def create_post(post_type: str):
             post: TextPost = TextPost(
                 title=data['title'],
                 content=data['content'],
-                author=User.objects(email=data['author']).first()
+                author=User.by_email(data['author'])
             ).save()
 
         elif post_type == 'image':
             post: ImagePost = ImagePost(
                 title=data['title'],
                 image_path=data['image_path'],
-                author=User.objects(email=data['author']).first()
+                author=User.by_email(data['author'])
             ).save()
 
         elif post_type == 'link':
             post: LinkPost = LinkPost(
                 title=data['title'],
                 link_url=data['link_url'],
-                author=User.objects(email=data['author']).first()
+                author=User.by_email(data['author'])
             ).save()
+
+        CollectionVersion.bump('post')
+        invalidate_author_pages(post.author_id)
+        Stat.record(post, posts=1)
+
         response = {
             'message': 'Post created successfully',
             'post': post.to_dict(),
@@ -81,21 +166,122 @@ def create_post(post_type: str):
             'status': 'error',
             'status_code': 500
         }
-    return Response(response=dumps(response), status=response['status_code'], mimetype='application/json')
+    return build_response(response)
+
+
+@post_blueprint.route('/post/bulk_create', methods=['POST'])
+def bulk_create_posts():
+    """
+    Create many posts of any type in one request.
+
+    Endpoint: /post/bulk_create
+    Method: POST
+
+    Body:
+    A list of posts, each with the fields of /post/create/<post_type> plus:
+    - post_type (str): Type of the post. Allowed values: 'text', 'image', 'link'.
+
+    Authors are resolved with a single query and the posts are inserted with one
+    unordered insert_many, so an invalid post does not prevent the others from being created.
+
+    Returns:
+    A JSON response containing the following fields:
+    - message (str): Success or error message.
+    - results (list): One result per post, in request order, with either the id of the
+      created post or an error message.
+    - created (int): Number of posts created.
+    - failed (int): Number of posts that could not be created.
+    - status (str): Status of the operation ('success' or 'error').
+    - status_code (int): HTTP status code (200 for success, 500 for error).
+
+    Example:
+    {
+        "message": "Posts created",
+        "results": [
+            {
+                "id": "6477f1b2c9e77c0001ab1234",
+                "status": "success"
+            },
+            {
+                "message": "Invalid post type",
+                "status": "error"
+            }
+        ],
+        "created": 1,
+        "failed": 1,
+        "status": "success",
+        "status_code": 200
+    }
+    """
+    try:
+        data: list = parse_items(request.get_json())
+
+        authors = User.by_emails([
+            item['author'] for item in data if isinstance(item, dict) and 'author' in item
+        ])
+
+        posts = []
+
+        def build(item: dict) -> Post:
+            if item.get('post_type') not in POST_TYPES:
+                raise Exception('Invalid post type')
+            document = POST_DOCUMENTS[item['post_type']]
+            field = POST_TYPE_FIELDS[document]
+            post = document(
+                title=item['title'], author=authors.get(item['author']), **{field: item[field]}
+            )
+            posts.append(post)
+            return post
+
+        results = bulk_create(Post, data, build)
+        CollectionVersion.bump('post')
+        invalidate_author_pages(*[author.id for author in authors.values()])
+        # only the posts that were inserted have an id
+        Stat.increment(Counter(key for post in posts if post.id is not None for key in Stat.keys(post)))
+        response = {
+            'message': 'Posts created',
+            'results': results,
+            **summary(results),
+            'status': 'success',
+            'status_code': 200
+        }
+    except Exception as e:
+        response = {
+            'message': str(e),
+            'status': 'error',
+            'status_code': 500
+        }
+    return build_response(response)
 
 
 @post_blueprint.route('/post/list', methods=['GET'])
+@cached_response('post', 'user')
 def list_posts():
     """
-    List all posts.
+    List posts, newest first, one page at a time.
 
     Endpoint: /post/list
     Method: GET
 
+    Query Parameters:
+    - limit (int, optional): Number of posts per page (default 20, max 100).
+    - after (str, optional): Cursor returned as next_cursor by the previous page.
+    - stream (bool, optional): When true, stream every post (ignoring limit/after) as chunked JSON;
+      406 when the Accept header does not allow JSON.
+    - batch_size (int, optional): Mongo cursor batch size when streaming (default 500, max 5000).
+    - fields (str, optional): Comma-separated fields to return, e.g. 'title,author,tags'.
+      Comments are only returned when requested explicitly.
+    - raw (bool, optional): When true, serialize straight from the BSON documents instead of
+      building mongoengine documents. The response is identical, only cheaper to produce.
+    - tag (str, optional, repeatable): Only list posts with this tag, e.g. ?tag=python&tag=flask.
+    - mode (str, optional): 'all' (default) for posts with every tag given, 'any' for posts
+      with at least one of them.
+
     Returns:
     A JSON response containing the following fields:
     - message (str): Success or error message.
     - posts (list): List of posts.
+    - next_cursor (str): Cursor of the next page, or null on the last page.
     - status (str): Status of the operation ('success' or 'error').
     - status_code (int): HTTP status code (200 for success, 500 for error).
 
@@ -116,17 +302,26 @@ def list_posts():
                 "post_type": "image"
             }
         ],
+        "next_cursor": "eyJpZCI6ICI2NDc3ZjFiMmM5ZTc3YzAwMDFhYjEyMzQifQ==",
         "status": "success",
         "status_code": 200
     }
     """
     try:
-        posts: list = []
-        for post in Post.objects:
-            posts.append(post.to_dict())
+        projection = Projection(request.args.get('fields'), Post, exclude=LIST_EXCLUDED_FIELDS)
+        queryset, serialize = list_queryset(Post, request.args)
+
+        if is_streaming(request.args):
+            return stream_response(
+                'posts', 'Posts listed successfully', queryset.order_by('-id'), request.args,
+                serialize=serialize, projection=projection
+            )
+
+        posts, next_cursor = paginate(projection.apply(queryset), request.args)
         response = {
             'message': 'Posts listed successfully',
-            'posts': posts,
+            'posts': [projection.select(post) for post in serialize(posts)],
+            'next_cursor': next_cursor,
             'status': 'success',
             'status_code': 200
         }
@@ -136,13 +331,14 @@ def list_posts():
             'status': 'error',
             'status_code': 500
         }
-    return Response(response=dumps(response), status=response['status_code'], mimetype='application/json')
+    return build_response(response)
 
 
 @post_blueprint.route('/post/list/<post_type>', methods=['GET'])
+@cached_response('post', 'user')
 def list_posts_by_type(post_type: str):
     """
-    List all posts of a specific type.
+    List posts of a specific type, newest first, one page at a time.
 
     Endpoint: /post/list/<post_type>
     Method: GET
@@ -150,10 +346,25 @@ def list_posts_by_type(post_type: str):
     Parameters:
     - post_type (str): Type of the post. Allowed values: 'text', 'image', 'link'.
 
+    Query Parameters:
+    - limit (int, optional): Number of posts per page (default 20, max 100).
+    - after (str, optional): Cursor returned as next_cursor by the previous page.
+    - stream (bool, optional): When true, stream every post (ignoring limit/after) as chunked JSON;
+      406 when the Accept header does not allow JSON.
+    - batch_size (int, optional): Mongo cursor batch size when streaming (default 500, max 5000).
+    - fields (str, optional): Comma-separated fields to return, e.g. 'title,author,tags'.
+      Comments are only returned when requested explicitly.
+    - raw (bool, optional): When true, serialize straight from the BSON documents instead of
+      building mongoengine documents. The response is identical, only cheaper to produce.
+    - tag (str, optional, repeatable): Only list posts with this tag, e.g. ?tag=python&tag=flask.
+    - mode (str, optional): 'all' (default) for posts with every tag given, 'any' for posts
+      with at least one of them.
+
     Returns:
     A JSON response containing the following fields:
     - message (str): Success or error message.
     - posts (list): List of posts.
+    - next_cursor (str): Cursor of the next page, or null on the last page.
     - status (str): Status of the operation ('success' or 'error').
     - status_code (int): HTTP status code (200 for success, 500 for error).
 
@@ -174,31 +385,116 @@ def list_posts_by_type(post_type: str):
                 "post_type": "image"
             }
         ],
+        "next_cursor": "eyJpZCI6ICI2NDc3ZjFiMmM5ZTc3YzAwMDFhYjEyMzQifQ==",
         "status": "success",
         "status_code": 200
     }
     """
     try:
-        posts: list = []
-
         if post_type not in POST_TYPES:
             raise Exception('Invalid post type')
 
-        if post_type == 'text':
-            for post in TextPost.objects:
-                posts.append(post.to_dict())
+        document = POST_DOCUMENTS[post_type]
+        projection = Projection(request.args.get('fields'), document, exclude=LIST_EXCLUDED_FIELDS)
+        queryset, serialize = list_queryset(document, request.args)
 
-        elif post_type == 'image':
-            for post in ImagePost.objects:
-                posts.append(post.to_dict())
+        if is_streaming(request.args):
+            return stream_response(
+                'posts', 'Posts listed successfully', queryset.order_by('-id'), request.args,
+                serialize=serialize, projection=projection
+            )
 
-        elif post_type == 'link':
-            for post in LinkPost.objects:
-                posts.append(post.to_dict())
+        posts, next_cursor = paginate(projection.apply(queryset), request.args)
 
         response = {
             'message': 'Posts listed successfully',
-            'posts': posts,
+            'posts': [projection.select(post) for post in serialize(posts)],
+            'next_cursor': next_cursor,
+            'status': 'success',
+            'status_code': 200
+        }
+    except Exception as e:
+        response = {
+            'message': str(e),
+            'status': 'error',
+            'status_code': 500
+        }
+    return build_response(response)
+
+
+@post_blueprint.route('/post/search', methods=['GET'])
+@cached_response('post', 'user')
+def search_posts():
+    """
+    Search posts by title, content and link URL, most relevant first, one page at a time.
+
+    Endpoint: /post/search
+    Method: GET
+
+    Query Parameters:
+    - q (str): Words or "quoted phrases" to search for; -word excludes a word.
+    - type (str, optional): Only search posts of this type. Allowed values: 'text', 'image', 'link'.
+    - limit (int, optional): Number of posts per page (default 20, max 100).
+    - after (str, optional): Cursor returned as next_cursor by the previous page.
+    - fields (str, optional): Comma-separated fields to return, e.g. 'title,author'.
+      Comments are only returned when requested explicitly.
+
+    Matches in the title weigh more than matches in the content, which weigh more than
+    matches in the link URL (see the post_text index of Post).
+
+    Returns:
+    A JSON response containing the following fields:
+    - message (str): Success or error message.
+    - posts (list): List of posts, each with its relevance score.
+    - next_cursor (str): Cursor of the next page, or null on the last page.
+    - status (str): Status of the operation ('success' or 'error').
+    - status_code (int): HTTP status code (200 for success, 500 for error).
+
+    Example:
+    {
+        "message": "Posts found successfully",
+        "posts": [
+            {
+                "id": "6477f1b2c9e77c0001ab1234",
+                "title": "Example Post",
+                "content": "Lorem ipsum dolor sit amet.",
+                "author": {
+                    "id": "6477f1b2c9e77c0001ab0001",
+                    "email": "john.doe@example.com",
+                    "first_name": "John",
+                    "last_name": "Doe"
+                },
+                "tags": ["python"],
+                "comment_count": 0,
+                "score": 10.75
+            }
+        ],
+        "next_cursor": "eyJzY29yZSI6IDEwLjc1LCAiaWQiOiAiNjQ3N2YxYjJjOWU3N2MwMDAxYWIxMjM0In0=",
+        "status": "success",
+        "status_code": 200
+    }
+    """
+    try:
+        query = request.args.get('q', '').strip()
+        if not query:
+            raise Exception('Search query not provided')
+
+        post_type = request.args.get('type')
+        if post_type is not None and post_type not in POST_TYPES:
+            raise Exception('Invalid post type')
+        document = POST_DOCUMENTS[post_type] if post_type else Post
+
+        projection = Projection(request.args.get('fields'), document, exclude=LIST_EXCLUDED_FIELDS)
+        queryset = for_lists(document.objects(__raw__={'$text': {'$search': query}}))
+        posts, next_cursor = paginate_search(queryset, request.args, projection.to_mongo())
+
+        response = {
+            'message': 'Posts found successfully',
+            'posts': [
+                {**projection.select(serialized), 'score': post['score']}
+                for post, serialized in zip(posts, serialize_raw_posts(posts))
+            ],
+            'next_cursor': next_cursor,
             'status': 'success',
             'status_code': 200
         }
@@ -208,7 +504,7 @@ def list_posts_by_type(post_type: str):
             'status': 'error',
             'status_code': 500
         }
-    return Response(response=dumps(response), status=response['status_code'], mimetype='application/json')
+    return build_response(response)
 
 
 @post_blueprint.route('/post/update/<post_id>', methods=['PUT'])
@@ -245,22 +541,44 @@ def update_post(post_id: str):
     try:
         data: dict = request.get_json()
 
-        post = Post.objects(id=post_id).first()
+        values = {}
+        if 'title' in data:
+            values['title'] = data['title']
+        if 'author' in data:
+            values['author'] = User.by_email(data['author'])
+
+        # The update returns the post as it was before, so that the previous author is read
+        # in the same atomic operation; the new values are then applied to it locally.
+        # A type-specific field is only applied when the post has that type, which the
+        # _cls filter of the subclass queryset checks within the same atomic update.
+        post = None
+        for document, field in POST_TYPE_FIELDS.items():
+            if field in data:
+                updates = {**values, field: data[field]}
+                post = document.objects(id=post_id).modify(new=False, **set_updates(document, updates))
+                break
+
+        if post is None:
+            updates = values
+            if values:
+                post = Post.objects(id=post_id).modify(new=False, **set_updates(Post, values))
+            else:
+                post = Post.objects(id=post_id).first()
         if not post:
             raise Exception('Post not found')
 
-        if 'title' in data:
-            post.title = data['title']
-        if 'content' in data and isinstance(post, TextPost):
-            post.content = data['content']
-        if 'image_path' in data and isinstance(post, ImagePost):
-            post.image_path = data['image_path']
-        if 'link_url' in data and isinstance(post, LinkPost):
-            post.link_url = data['link_url']
-        if 'author' in data:
-            post.author = User.objects(email=data['author']).first()
+        previous_author_id = post.author_id
+        for name, value in updates.items():
+            setattr(post, name, value)
 
-        post.save()
+        CollectionVersion.bump('post')
+        invalidate_author_pages(previous_author_id, post.author_id)
+        if 'author' in data and previous_author_id != post.author_id:
+            Stat.transfer(
+                previous_author_id and f'author:{previous_author_id}',
+                post.author_id and f'author:{post.author_id}',
+                posts=1, comments=post.comment_count
+            )
 
         response = {
             'message': 'Post updated successfully',
@@ -274,7 +592,7 @@ def update_post(post_id: str):
             'status': 'error',
             'status_code': 500
         }
-    return Response(response=dumps(response), status=response['status_code'], mimetype='application/json')
+    return build_response(response)
 
 
 @post_blueprint.route('/post/delete/<post_id>', methods=['DELETE'])
@@ -309,11 +627,21 @@ def delete_post(post_id: str):
     }
     """
     try:
-        post = Post.objects(id=post_id).first()
+        # find_one_and_delete: of concurrent deletes of a post, only one gets the post back
+        # and updates the counters
+        post = Post.objects(id=post_id).modify(remove=True)
         if not post:
             raise Exception('Post not found')
 
-        post.delete()
+        # the atomic delete bypasses the CASCADE rule of PostComment.post
+        PostComment.objects(post=post.id).delete(write_concern=comment_write_concern())
+        if post.tags:
+            Tag.objects(name__in=post.tags).update(dec__post_count=1)
+        CollectionVersion.bump('post', 'tag')
+        invalidate_author_pages(post.author_id)
+        # from the deleted document itself, so that a repeated delete subtracts nothing and
+        # the comments added until the delete are subtracted too
+        Stat.record(post, posts=-1, comments=-post.comment_count)
 
         response = {
             'message': 'Post deleted successfully',
@@ -327,7 +655,7 @@ def delete_post(post_id: str):
             'status': 'error',
             'status_code': 500
         }
-    return Response(response=dumps(response), status=response['status_code'], mimetype='application/json')
+    return build_response(response)
 
 
 @post_blueprint.route('/post/add_tag/<post_id>/<tag_id>', methods=['PUT'])
@@ -365,16 +693,22 @@ def add_tag_to_post(post_id: str, tag_id: str):
     }
     """
     try:
-        post = Post.objects(id=post_id).first()
-        if not post:
-            raise Exception('Post not found')
-
         tag = Tag.objects(id=tag_id).first()
         if not tag:
             raise Exception('Tag not found')
 
-        post.tags.append(tag)
-        post.save()
+        # the tags__ne filter makes the update match only when the tag is new to the post
+        post = Post.objects(id=post_id, tags__ne=tag.name).modify(new=True, add_to_set__tags=tag.name)
+        if post:
+            Tag.objects(id=tag.id).update_one(inc__post_count=1)
+            Stat.record(post, posts=1, comments=post.comment_count, tags=[tag.name])
+        else:
+            post = Post.objects(id=post_id).first()
+            if not post:
+                raise Exception('Post not found')
+
+        CollectionVersion.bump('post', 'tag')
+        invalidate_author_pages(post.author_id)
 
         response = {
             'message': 'Tag added successfully',
@@ -388,7 +722,7 @@ def add_tag_to_post(post_id: str, tag_id: str):
             'status': 'error',
             'status_code': 500
         }
-    return Response(response=dumps(response), status=response['status_code'], mimetype='application/json')
+    return build_response(response)
 
 
 @post_blueprint.route('/post/remove_tag/<post_id>/<tag_id>', methods=['PUT'])
@@ -422,16 +756,21 @@ def remove_tag_from_post(post_id: str, tag_id: str):
     }
     """
     try:
-        post = Post.objects(id=post_id).first()
-        if not post:
-            raise Exception('Post not found')
-
         tag = Tag.objects(id=tag_id).first()
         if not tag:
             raise Exception('Tag not found')
 
-        post.tags.remove(tag)
-        post.save()
+        post = Post.objects(id=post_id, tags=tag.name).modify(new=True, pull__tags=tag.name)
+        if post:
+            Tag.objects(id=tag.id).update_one(dec__post_count=1)
+            Stat.record(post, posts=-1, comments=-post.comment_count, tags=[tag.name])
+        else:
+            post = Post.objects(id=post_id).first()
+            if not post:
+                raise Exception('Post not found')
+
+        CollectionVersion.bump('post', 'tag')
+        invalidate_author_pages(post.author_id)
 
         response = {
             'message': 'Tag removed successfully',
@@ -445,7 +784,7 @@ def remove_tag_from_post(post_id: str, tag_id: str):
             'status': 'error',
             'status_code': 500
         }
-    return Response(response=dumps(response), status=response['status_code'], mimetype='application/json')
+    return build_response(response)
 
 
 @post_blueprint.route('/post/add_comment/<post_id>', methods=['POST'])
@@ -464,12 +803,21 @@ def add_comment_to_post(post_id: str):
     - email (str): Email of the commenter.
     - body (str): Body of the comment.
 
+    The comment is stored in its own collection; the post keeps a comment count and
+    embeds only the latest comments. Use /post/<post_id>/comments to list all of them.
+    The comment id is assigned by the server, a body giving one is rejected.
+
+    When the app runs with COMMENT_QUEUE, the comment is only queued and written within
+    COMMENT_QUEUE_INTERVAL seconds: the response is a 202 with the comment instead of the
+    post, and a 500 when the queue stays full for COMMENT_QUEUE_PUT_TIMEOUT seconds.
+
     Returns:
     A JSON response containing the following fields:
     - message (str): Success or error message.
     - post (dict): Post details if comment added successfully.
+    - comment (dict): Comment details if comment queued.
     - status (str): Status of the operation ('success' or 'error').
-    - status_code (int): HTTP status code (200 for success, 500 for error).
+    - status_code (int): HTTP status code (200 for success, 202 for queued, 500 for error).
 
     Example:
     {
@@ -482,34 +830,60 @@ def add_comment_to_post(post_id: str):
                     "email": "johndoe@exampleemail.com",
                     "body": "Example comment body"
                 }
-            ]
+            ],
+            "comment_count": 1
         },
         "status": "success",
         "status_code": 200
     }
     """
     try:
-        post = Post.objects(id=post_id).first()
-        if not post:
-            raise Exception('Post not found')
-
-        comment = Comment(**request.json)
-        post.comments.append(comment)
-        post.save()
-
-        response = {
-            'message': 'Comment added successfully',
-            'post': post.to_dict(),
-            'status': 'success',
-            'status_code': 200
-        }
+        data: dict = request.json
+        if 'id' in data:
+            raise Exception('Comment id cannot be set')
+        comment = Comment(**data)
+        comment.validate()
+
+        queue = current_app.extensions.get('comment_queue')
+        if queue is not None:
+            queue.put(ObjectId(post_id), comment)
+            response = {
+                'message': 'Comment queued',
+                'comment': comment.to_dict(),
+                'status': 'success',
+                'status_code': 202
+            }
+        else:
+            # the comment is stored before the post embeds and counts it, so that a failed
+            # insert cannot leave the post with a comment that does not exist
+            PostComment(
+                id=comment.id, post=ObjectId(post_id), content=comment.content, name=comment.name
+            ).save(write_concern=comment_write_concern())
+            post = update_post_comments(post_id, {
+                '$push': {'comments': {'$each': [comment.to_mongo()], '$slice': -RECENT_COMMENTS}},
+                '$inc': {'comment_count': 1}
+            })
+            if not post:
+                PostComment.objects(id=comment.id).delete(write_concern=comment_write_concern())
+                raise Exception('Post not found')
+
+            CollectionVersion.bump('post')
+            invalidate_author_pages(post.author_id)
+            Stat.record(post, comments=1)
+
+            response = {
+                'message': 'Comment added successfully',
+                'post': post.to_dict(),
+                'status': 'success',
+                'status_code': 200
+            }
     except Exception as e:
         response = {
             'message': str(e),
             'status': 'error',
             'status_code': 500
         }
-    return Response(response=dumps(response), status=response['status_code'], mimetype='application/json')
+    return build_response(response)
 
 
 @post_blueprint.route('/post/remove_comment/<post_id>/<comment_id>', methods=['DELETE'])
@@ -536,23 +910,29 @@ def remove_comment_from_post(post_id: str, comment_id: str):
         "message": "Comment removed successfully",
         "post": {
             "title": "Example Post",
-            "comments": []
+            "comments": [],
+            "comment_count": 0
         },
         "status": "success",
         "status_code": 200
     }
     """
     try:
-        post = Post.objects(id=post_id).first()
+        comments = PostComment.objects(id=comment_id, post=post_id)
+        if not comments.delete(write_concern=comment_write_concern()):
+            raise Exception('Comment not found')
+
+        post = update_post_comments(post_id, {
+            '$inc': {'comment_count': -1},
+            '$pull': {'comments': {'id': ObjectId(comment_id)}}
+        })
         if not post:
             raise Exception('Post not found')
+        post = refill_recent_comments(post)
 
-        comment = Comment.objects(id=comment_id).first()
-        if not comment:
-            raise Exception('Comment not found')
-
-        post.comments.remove(comment)
-        post.save()
+        CollectionVersion.bump('post')
+        invalidate_author_pages(post.author_id)
+        Stat.record(post, comments=-1)
 
         response = {
             'message': 'Comment removed successfully',
@@ -566,4 +946,61 @@ def remove_comment_from_post(post_id: str, comment_id: str):
             'status': 'error',
             'status_code': 500
         }
-    return Response(response=dumps(response), status=response['status_code'], mimetype='application/json')
+    return build_response(response)
+
+
+@post_blueprint.route('/post/<post_id>/comments', methods=['GET'])
+@cached_response('post')
+def list_post_comments(post_id: str):
+    """
+    List the comments of a post, newest first, one page at a time.
+
+    Endpoint: /post/<post_id>/comments
+    Method: GET
+
+    Parameters:
+    - post_id (str): ID of the post.
+
+    Query Parameters:
+    - limit (int, optional): Number of comments per page (default 20, max 100).
+    - after (str, optional): Cursor returned as next_cursor by the previous page.
+
+    Returns:
+    A JSON response containing the following fields:
+    - message (str): Success or error message.
+    - comments (list): List of comments.
+    - next_cursor (str): Cursor of the next page, or null on the last page.
+    - status (str): Status of the operation ('success' or 'error').
+    - status_code (int): HTTP status code (200 for success, 500 for error).
+
+    Example:
+    {
+        "message": "Comments listed successfully",
+        "comments": [
+            {
+                "id": "6477f1b2c9e77c0001ab1234",
+                "content": "Example comment body",
+                "name": "Example Commenter"
+            }
+        ],
+        "next_cursor": null,
+        "status": "success",
+        "status_code": 200
+    }
+    """
+    try:
+        comments, next_cursor = paginate(for_lists(PostComment.objects(post=post_id)), request.args)
+        response = {
+            'message': 'Comments listed successfully',
+            'comments': [comment.to_dict() for comment in comments],
+            'next_cursor': next_cursor,
+            'status': 'success',
+            'status_code': 200
+        }
+    except Exception as e:
+        response = {
+            'message': str(e),
+            'status': 'error',
+            'status_code': 500
+        }
+    return build_response(response)
@@ -0,0 +1,148 @@
+from flask import Blueprint
+from bson import ObjectId
+from application.models.stat import Stat
+from application.shared.responses import build_response
+from application.shared.post_types import POST_DOCUMENTS
+
+stats_blueprint = Blueprint('stats_blueprint', __name__)
+
+
+@stats_blueprint.route('/stats', methods=['GET'])
+def get_stats():
+    """
+    Get the number of posts and comments in total and per post type.
+
+    Endpoint: /stats
+    Method: GET
+
+    The counters are maintained as posts and comments are written, so reading them costs
+    one query whatever the number of posts.
+
+    Returns:
+    A JSON response containing the following fields:
+    - message (str): Success or error message.
+    - stats (dict): Posts and comments in total and by post type.
+    - status (str): Status of the operation ('success' or 'error').
+    - status_code (int): HTTP status code (200 for success, 500 for error).
+
+    Example:
+    {
+        "message": "Stats retrieved successfully",
+        "stats": {
+            "total": {"posts": 120, "comments": 310},
+            "types": {
+                "text": {"posts": 80, "comments": 250},
+                "image": {"posts": 25, "comments": 40},
+                "link": {"posts": 15, "comments": 20}
+            }
+        },
+        "status": "success",
+        "status_code": 200
+    }
+    """
+    try:
+        keys = {
+            post_type: f'type:{document._class_name}' for post_type, document in POST_DOCUMENTS.items()
+        }
+        stats = Stat.read(['total', *keys.values()])
+        response = {
+            'message': 'Stats retrieved successfully',
+            'stats': {
+                'total': stats['total'],
+                'types': {post_type: stats[key] for post_type, key in keys.items()}
+            },
+            'status': 'success',
+            'status_code': 200
+        }
+    except Exception as e:
+        response = {
+            'message': str(e),
+            'status': 'error',
+            'status_code': 500
+        }
+    return build_response(response)
+
+
+@stats_blueprint.route('/stats/tag/<name>', methods=['GET'])
+def get_tag_stats(name: str):
+    """
+    Get the number of posts with a tag and of comments on them.
+
+    Endpoint: /stats/tag/<name>
+    Method: GET
+
+    Parameters:
+    - name (str): Name of the tag.
+
+    Returns:
+    A JSON response containing the following fields:
+    - message (str): Success or error message.
+    - stats (dict): Posts and comments of the tag.
+    - status (str): Status of the operation ('success' or 'error').
+    - status_code (int): HTTP status code (200 for success, 500 for error).
+
+    Example:
+    {
+        "message": "Stats retrieved successfully",
+        "stats": {"posts": 12, "comments": 30},
+        "status": "success",
+        "status_code": 200
+    }
+    """
+    try:
+        response = {
+            'message': 'Stats retrieved successfully',
+            'stats': Stat.read([f'tag:{name}'])[f'tag:{name}'],
+            'status': 'success',
+            'status_code': 200
+        }
+    except Exception as e:
+        response = {
+            'message': str(e),
+            'status': 'error',
+            'status_code': 500
+        }
+    return build_response(response)
+
+
+@stats_blueprint.route('/stats/author/<user_id>', methods=['GET'])
+def get_author_stats(user_id: str):
+    """
+    Get the number of posts of a user and of comments on them.
+
+    Endpoint: /stats/author/<user_id>
+    Method: GET
+
+    Parameters:
+    - user_id (str): ID of the user.
+
+    Returns:
+    A JSON response containing the following fields:
+    - message (str): Success or error message.
+    - stats (dict): Posts and comments of the user.
+    - status (str): Status of the operation ('success' or 'error').
+    - status_code (int): HTTP status code (200 for success, 500 for error).
+
+    Example:
+    {
+        "message": "Stats retrieved successfully",
+        "stats": {"posts": 4, "comments": 9},
+        "status": "success",
+        "status_code": 200
+    }
+    """
+    try:
+        key = f'author:{ObjectId(user_id)}'
+        response = {
+            'message': 'Stats retrieved successfully',
+            'stats': Stat.read([key])[key],
+            'status': 'success',
+            'status_code': 200
+        }
+    except Exception as e:
+        response = {
+            'message': str(e),
+            'status': 'error',
+            'status_code': 500
+        }
+    return build_response(response)
@@ -0,0 +1,85 @@
+from flask import Blueprint, current_app, Response
+from application.shared.metrics import render_metrics
+from application.shared.monitoring import pool_stats
+from application.shared.responses import build_response
+
+system_blueprint = Blueprint('system_blueprint', __name__)
+
+# MONGODB_SETTINGS reported next to the pool statistics
+POOL_SETTINGS = ['maxPoolSize', 'minPoolSize', 'maxIdleTimeMS', 'waitQueueTimeoutMS']
+
+
+@system_blueprint.route('/system/pool_stats', methods=['GET'])
+def get_pool_stats():
+    """
+    Get the statistics of the Mongo connection pools of this process.
+
+    Endpoint: /system/pool_stats
+    Method: GET
+
+    Returns:
+    A JSON response containing the following fields:
+    - message (str): Success or error message.
+    - settings (dict): Pool settings of the connection, when set.
+    - pools (dict): Statistics of the pool of every server, by address.
+    - status (str): Status of the operation ('success' or 'error').
+    - status_code (int): HTTP status code (200 for success, 500 for error).
+
+    Example:
+    {
+        "message": "Pool stats retrieved successfully",
+        "settings": {
+            "maxPoolSize": 100
+        },
+        "pools": {
+            "localhost:27017": {
+                "open": 4,
+                "checked_out": 1,
+                "max_checked_out": 3,
+                "created": 4,
+                "closed": 0,
+                "checkouts": 120,
+                "checkout_failures": 0,
+                "pool_clears": 0
+            }
+        },
+        "status": "success",
+        "status_code": 200
+    }
+    """
+    try:
+        settings = current_app.config['MONGODB_SETTINGS']
+        response = {
+            'message': 'Pool stats retrieved successfully',
+            'settings': {name: settings[name] for name in POOL_SETTINGS if name in settings},
+            'pools': pool_stats.stats(),
+            'status': 'success',
+            'status_code': 200
+        }
+    except Exception as e:
+        response = {
+            'message': str(e),
+            'status': 'error',
+            'status_code': 500
+        }
+    return build_response(response)
+
+
+@system_blueprint.route('/metrics', methods=['GET'])
+def get_metrics():
+    """
+    Expose the metrics of this process to Prometheus.
+
+    Endpoint: /metrics
+    Method: GET
+
+    Returns:
+    The metrics in the Prometheus text exposition format: request counts, latency and
+    response size histograms by route, Mongo command counts and latency histograms by
+    collection and command, user cache and connection pool gauges.
+
+    Example:
+    http_requests_total{route="/post/list",method="GET",status="200"} 42
+    mongo_command_duration_seconds_bucket{collection="post",command="find",le="0.001"} 40
+    """
+    return Response(render_metrics(), mimetype='text/plain; version=0.0.4')
@@ -1,10 +1,18 @@
 from flask import (
     Blueprint,
-    Response,
     request,
 )
+from application.models.post import Post
 from application.models.tag import Tag
-from json import dumps
+from application.models.stat import Stat
+from application.models.user import invalidate_all_author_pages
+from application.models.collection_version import CollectionVersion
+from application.shared.bulk import parse_items, bulk_create, summary
+from application.shared.projection import Projection
+from application.shared.response_cache import cached_response
+from application.shared.routing import for_lists
+from application.shared.responses import build_response
+from application.shared.streaming import is_streaming, stream_response
 
 tag_blueprint = Blueprint('tag_blueprint', __name__)
 
@@ -46,6 +54,8 @@ def create_tag():
         tag = Tag(name=data['name'])
         tag.save()
 
+        CollectionVersion.bump('tag')
+
         response = {
             'message': 'Tag created successfully',
             'tag': tag.to_dict(),
@@ -58,10 +68,76 @@ def create_tag():
             'status': 'error',
             'status_code': 500
         }
-    return Response(response=dumps(response), status=response['status_code'], mimetype='application/json')
+    return build_response(response)
+
+
+@tag_blueprint.route('/tag/bulk_create', methods=['POST'])
+def bulk_create_tags():
+    """
+    Create many tags in one request.
+
+    Endpoint: /tag/bulk_create
+    Method: POST
+
+    Body:
+    A list of tags, each with the fields of /tag/create.
+
+    The tags are inserted with one unordered insert_many, so an invalid or duplicate
+    tag does not prevent the others from being created.
+
+    Returns:
+    A JSON response containing the following fields:
+    - message (str): Success or error message.
+    - results (list): One result per tag, in request order, with either the id of the
+      created tag or an error message.
+    - created (int): Number of tags created.
+    - failed (int): Number of tags that could not be created.
+    - status (str): Status of the operation ('success' or 'error').
+    - status_code (int): HTTP status code (201 for success, 500 for error).
+
+    Example:
+    {
+        "message": "Tags created",
+        "results": [
+            {
+                "id": "6477f1b2c9e77c0001ab1234",
+                "status": "success"
+            }
+        ],
+        "created": 1,
+        "failed": 0,
+        "status": "success",
+        "status_code": 201
+    }
+    """
+    try:
+        data: list = parse_items(request.get_json())
+
+        def build(item: dict) -> Tag:
+            if 'name' not in item:
+                raise Exception('Tag name not provided')
+            return Tag(name=item['name'])
+
+        results = bulk_create(Tag, data, build)
+        CollectionVersion.bump('tag')
+        response = {
+            'message': 'Tags created',
+            'results': results,
+            **summary(results),
+            'status': 'success',
+            'status_code': 201
+        }
+    except Exception as e:
+        response = {
+            'message': str(e),
+            'status': 'error',
+            'status_code': 500
+        }
+    return build_response(response)
 
 
 @tag_blueprint.route('/tag/list', methods=['GET'])
+@cached_response('tag', 'post')
 def list_tags():
     """
     List all tags.
@@ -69,6 +145,14 @@ def list_tags():
     Endpoint: /tag/list
     Method: GET
 
+    Query Parameters:
+    - stream (bool, optional): When true, stream the tags as chunked JSON; 406 when the
+      Accept header does not allow JSON.
+    - batch_size (int, optional): Mongo cursor batch size when streaming (default 500, max 5000).
+    - fields (str, optional): Comma-separated fields to return, e.g. 'name'.
+    - counts (str, optional): 'live' to count the posts of every tag with one aggregation
+      instead of returning the maintained post_count of each tag.
+
     Returns:
     A JSON response containing the following fields:
     - message (str): Success or error message.
@@ -81,7 +165,8 @@ def list_tags():
         "message": "Tags listed successfully",
         "tags": [
             {
-                "name": "Example Tag"
+                "name": "Example Tag",
+                "post_count": 12
             }
         ],
         "status": "success",
@@ -89,9 +174,22 @@ def list_tags():
     }
     """
     try:
+        projection = Projection(request.args.get('fields'), Tag)
+        # only the declared fields, leaving out the posts array of tags not migrated yet
+        queryset = for_lists(Tag.objects.only(*Tag._fields))
+
+        if is_streaming(request.args):
+            return stream_response(
+                'tags', 'Tags listed successfully', queryset, request.args, projection=projection
+            )
+
         tags = []
-        for tag in Tag.objects:
-            tags.append(tag.to_dict())
+        if request.args.get('counts') == 'live':
+            for tag in Tag.live_counts():
+                tags.append(projection.select(tag))
+        else:
+            for tag in projection.apply(queryset):
+                tags.append(projection.select(tag.to_dict()))
 
         response = {
             'message': 'Tags listed successfully',
@@ -105,7 +203,7 @@ def list_tags():
             'status': 'error',
             'status_code': 500
         }
-    return Response(response=dumps(response), status=response['status_code'], mimetype='application/json')
+    return build_response(response)
 
 
 @tag_blueprint.route('/tag/update/<tag_id>', methods=['PUT'])
@@ -144,11 +242,19 @@ def update_tag(tag_id: str):
         if not tag:
             raise Exception('Tag not found')
 
+        name = tag.name
         if 'name' in data:
             tag.name = data['name']
 
         tag.save()
 
+        if tag.name != name:
+            Post.objects(tags=name).update(set__tags__S=tag.name)
+            CollectionVersion.bump('post')
+            invalidate_all_author_pages()
+            Stat.rename(f'tag:{name}', f'tag:{tag.name}')
+        CollectionVersion.bump('tag')
+
         response = {
             'message': 'Tag updated successfully',
             'tag': tag.to_dict(),
@@ -161,7 +267,7 @@ def update_tag(tag_id: str):
             'status': 'error',
             'status_code': 500
         }
-    return Response(response=dumps(response), status=response['status_code'], mimetype='application/json')
+    return build_response(response)
 
 
 @tag_blueprint.route('/tag/delete/<tag_id>', methods=['DELETE'])
@@ -199,6 +305,11 @@ def delete_tag(tag_id: str):
 
         tag.delete()
 
+        Post.objects(tags=tag.name).update(pull__tags=tag.name)
+        invalidate_all_author_pages()
+        Stat.objects(id=f'tag:{tag.name}').delete()
+        CollectionVersion.bump('tag', 'post')
+
         response = {
             'message': 'Tag deleted successfully',
             'tag': tag.to_dict(),
@@ -211,4 +322,4 @@ def delete_tag(tag_id: str):
             'status': 'error',
             'status_code': 500
         }
-    return Response(response=dumps(response), status=response['status_code'], mimetype='application/json')
+    return build_response(response)
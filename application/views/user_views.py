@@ -1,6 +1,15 @@
-from flask import Blueprint, request, Response
-from json import dumps
-from application.models.user import User
+from bson import ObjectId
+from flask import Blueprint, request
+from application.models.post import Post
+from application.models.collection_version import CollectionVersion
+from application.models.user import User, user_cache, author_page_cache, author_page_versions
+from application.serializers.raw import serialize_raw_posts
+from application.shared.bulk import parse_items, bulk_create, summary
+from application.shared.constants import LIST_EXCLUDED_FIELDS
+from application.shared.pagination import paginate
+from application.shared.projection import Projection
+from application.shared.responses import build_response
+from application.shared.routing import for_lists, lists_read_primary
 
 user_blueprint = Blueprint('user_blueprint', __name__)
 
@@ -56,4 +65,240 @@ def create_user():
             'status': 'error',
             'status_code': 500
         }
-    return Response(response=dumps(response), status=response['status_code'], mimetype='application/json')
+    return build_response(response)
+
+
+@user_blueprint.route('/user/bulk_create', methods=['POST'])
+def bulk_create_users():
+    """
+    Create many users in one request.
+
+    Endpoint: /user/bulk_create
+    Method: POST
+
+    Body:
+    A list of users, each with the fields of /user/create.
+
+    The users are inserted with one unordered insert_many, so an invalid or duplicate
+    user does not prevent the others from being created.
+
+    Returns:
+    A JSON response containing the following fields:
+    - message (str): Success or error message.
+    - results (list): One result per user, in request order, with either the id of the
+      created user or an error message.
+    - created (int): Number of users created.
+    - failed (int): Number of users that could not be created.
+    - status (str): Status of the operation ('success' or 'error').
+    - status_code (int): HTTP status code (200 for success, 500 for error).
+
+    Example:
+    {
+        "message": "Users created",
+        "results": [
+            {
+                "id": "6477f1b2c9e77c0001ab1234",
+                "status": "success"
+            }
+        ],
+        "created": 1,
+        "failed": 0,
+        "status": "success",
+        "status_code": 200
+    }
+    """
+    try:
+        data: list = parse_items(request.get_json())
+
+        def build(item: dict) -> User:
+            return User(
+                email=item['email'],
+                first_name=item['first_name'],
+                last_name=item['last_name']
+            )
+
+        results = bulk_create(User, data, build)
+        response = {
+            'message': 'Users created',
+            'results': results,
+            **summary(results),
+            'status': 'success',
+            'status_code': 200
+        }
+    except Exception as e:
+        response = {
+            'message': str(e),
+            'status': 'error',
+            'status_code': 500
+        }
+    return build_response(response)
+
+
+def author_posts(user_id: str, args: dict) -> tuple:
+    """
+    One page of the posts of an author, newest first, as (posts, next_cursor). The first
+    page with the default limit and fields is served from author_page_cache, unless list
+    reads may go to secondaries. A cached page is only served while the versions of
+    author_page_versions() it was cached under are current, so writes made by other
+    processes invalidate it too, within VERSION_POLL_INTERVAL seconds.
+    """
+    user_id = str(ObjectId(user_id))
+    cacheable = lists_read_primary() and not any(args.get(name) for name in ('after', 'limit', 'fields'))
+    if cacheable:
+        versions = CollectionVersion.polled(author_page_versions(user_id))
+        entry = author_page_cache.get(user_id, valid=lambda entry: entry[0] == versions)
+        if entry is not None:
+            return entry[1]
+
+    projection = Projection(args.get('fields'), Post, exclude=LIST_EXCLUDED_FIELDS)
+    queryset = for_lists(Post.objects(author=user_id)).as_pymongo()
+    posts, next_cursor = paginate(projection.apply(queryset), args)
+    page = ([projection.select(post) for post in serialize_raw_posts(posts)], next_cursor)
+    if cacheable:
+        author_page_cache.set(user_id, (versions, page))
+    return page
+
+
+@user_blueprint.route('/user/<user_id>/posts', methods=['GET'])
+def list_user_posts(user_id: str):
+    """
+    List the posts of a user, newest first, one page at a time.
+
+    Endpoint: /user/<user_id>/posts
+    Method: GET
+
+    Parameters:
+    - user_id (str): ID of the user.
+
+    Query Parameters:
+    - limit (int, optional): Number of posts per page (default 20, max 100).
+    - after (str, optional): Cursor returned as next_cursor by the previous page.
+    - fields (str, optional): Comma-separated fields to return, e.g. 'title,tags'.
+      Comments are only returned when requested explicitly.
+
+    Returns:
+    A JSON response containing the following fields:
+    - message (str): Success or error message.
+    - posts (list): List of posts.
+    - next_cursor (str): Cursor of the next page, or null on the last page.
+    - status (str): Status of the operation ('success' or 'error').
+    - status_code (int): HTTP status code (200 for success, 500 for error).
+
+    Example:
+    {
+        "message": "Posts listed successfully",
+        "posts": [
+            {
+                "id": "6477f1b2c9e77c0001ab1234",
+                "title": "Example Post",
+                "content": "Lorem ipsum dolor sit amet.",
+                "author": {
+                    "id": "6477f1b2c9e77c0001ab0001",
+                    "email": "john.doe@example.com",
+                    "first_name": "John",
+                    "last_name": "Doe"
+                },
+                "tags": [],
+                "comment_count": 0
+            }
+        ],
+        "next_cursor": null,
+        "status": "success",
+        "status_code": 200
+    }
+    """
+    try:
+        posts, next_cursor = author_posts(user_id, request.args)
+        response = {
+            'message': 'Posts listed successfully',
+            'posts': posts,
+            'next_cursor': next_cursor,
+            'status': 'success',
+            'status_code': 200
+        }
+    except Exception as e:
+        response = {
+            'message': str(e),
+            'status': 'error',
+            'status_code': 500
+        }
+    return build_response(response)
+
+
+@user_blueprint.route('/user/by_email/<email>/posts', methods=['GET'])
+def list_user_posts_by_email(email: str):
+    """
+    List the posts of a user found by email, newest first, one page at a time.
+
+    Endpoint: /user/by_email/<email>/posts
+    Method: GET
+
+    Parameters:
+    - email (str): Email of the user.
+
+    Query Parameters and Returns: see /user/<user_id>/posts.
+    """
+    try:
+        user = User.by_email(email)
+        if not user:
+            raise Exception('User not found')
+
+        posts, next_cursor = author_posts(str(user.id), request.args)
+        response = {
+            'message': 'Posts listed successfully',
+            'posts': posts,
+            'next_cursor': next_cursor,
+            'status': 'success',
+            'status_code': 200
+        }
+    except Exception as e:
+        response = {
+            'message': str(e),
+            'status': 'error',
+            'status_code': 500
+        }
+    return build_response(response)
+
+
+@user_blueprint.route('/user/cache_stats', methods=['GET'])
+def user_cache_stats():
+    """
+    Report the hit/miss counters of the email to user cache.
+
+    Endpoint: /user/cache_stats
+    Method: GET
+
+    Returns:
+    A JSON response containing the following fields:
+    - message (str): Success or error message.
+    - cache (dict): Hits, misses, current size and maximum size of the cache.
+    - status (str): Status of the operation ('success' or 'error').
+    - status_code (int): HTTP status code (200 for success, 500 for error).
+
+    Example:
+    {
+        "message": "Cache stats retrieved successfully",
+        "cache": {
+            "hits": 1520,
+            "misses": 48,
+            "size": 48,
+            "maxsize": 10000
+        },
+        "status": "success",
+        "status_code": 200
+    }
+    """
+    try:
+        response = {
+            'message': 'Cache stats retrieved successfully',
+            'cache': user_cache.stats(),
+            'status': 'success',
+            'status_code': 200
+        }
+    except Exception as e:
+        response = {
+            'message': str(e),
+            'status': 'error',
+            'status_code': 500
+        }
+    return build_response(response)
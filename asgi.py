@@ -0,0 +1,7 @@
+from application.aio import create_app
+from quart import Quart
+
+app: Quart = create_app()
+
+if __name__ == '__main__':
+    app.run(debug=True)
@@ -0,0 +1,118 @@
+"""
+Synthetic tumblelog dataset for the load benchmarks: users, a mix of text, image and link
+posts with tags, and posts with long comment histories. The same seed always produces the
+same dataset; documents are validated by their models and written with insert_many.
+"""
+from dataclasses import dataclass
+from random import Random
+from application.commands.index_commands import INDEXED_DOCUMENTS
+from application.models.user import User
+from application.models.text_post import TextPost
+from application.models.image_post import ImagePost
+from application.models.link_post import LinkPost
+from application.models.tag import Tag
+from application.models.post_comment import PostComment
+from application.shared.constants import RECENT_COMMENTS
+
+POST_VALUES = [
+    (TextPost, 'content', 'Lorem ipsum dolor sit amet, consectetur adipiscing elit.'),
+    (ImagePost, 'image_path', '/images/example.jpg'),
+    (LinkPost, 'link_url', 'https://example.com/some/article')
+]
+
+
+@dataclass
+class DatasetSize:
+    users: int = 100
+    posts: int = 5000
+    tags: int = 50
+    # the first commented_posts posts get comments_per_post comments each
+    commented_posts: int = 50
+    comments_per_post: int = 200
+    seed: int = 0
+
+
+@dataclass
+class Dataset:
+    """
+    Ids and names of the seeded documents, for building benchmark requests.
+    """
+    emails: list
+    user_ids: list
+    post_ids: list
+    tag_ids: list
+    tag_names: list
+    commented_post_ids: list
+
+
+def _insert(document, instances: list, batch_size: int = 1000):
+    for instance in instances:
+        instance.validate()
+    collection = document._get_collection()
+    for start in range(0, len(instances), batch_size):
+        batch = instances[start:start + batch_size]
+        sons = [instance.to_mongo() for instance in batch]
+        collection.insert_many(sons)
+        for instance, son in zip(batch, sons):
+            instance.id = son['_id']
+
+
+def seed_dataset(size: DatasetSize) -> Dataset:
+    """
+    Drop the benchmark collections, create their indexes and insert a dataset of the given size.
+    """
+    random = Random(size.seed)
+    for document in INDEXED_DOCUMENTS:
+        document.drop_collection()
+        document.ensure_indexes()
+
+    users = [
+        User(email=f'user{index}@example.com', first_name=f'First{index}', last_name=f'Last{index}')
+        for index in range(size.users)
+    ]
+    _insert(User, users)
+
+    tag_names = [f'tag{index}' for index in range(size.tags)]
+    post_counts = dict.fromkeys(tag_names, 0)
+
+    posts = []
+    for index in range(size.posts):
+        document, field, value = POST_VALUES[index % len(POST_VALUES)]
+        tags = random.sample(tag_names, min(len(tag_names), random.randint(0, 3)))
+        for name in tags:
+            post_counts[name] += 1
+        posts.append(document(
+            title=f'Post {index}', author=random.choice(users), tags=tags, comment_count=0,
+            **{field: value}
+        ))
+
+    comments = []
+    commented = posts[:size.commented_posts]
+    for post in commented:
+        post.comment_count = size.comments_per_post
+        post_comments = [
+            PostComment(
+                post=post, content=f'Comment {index}', name=f'Commenter {random.randrange(size.users)}'
+            )
+            for index in range(size.comments_per_post)
+        ]
+        comments.append((post, post_comments))
+
+    for document, _, _ in POST_VALUES:
+        _insert(document, [post for post in posts if type(post) is document])
+
+    for post, post_comments in comments:
+        _insert(PostComment, post_comments)
+        post.update(set__comments=[comment.to_comment() for comment in post_comments[-RECENT_COMMENTS:]])
+
+    tags = [Tag(name=name, post_count=post_counts[name]) for name in tag_names]
+    _insert(Tag, tags)
+
+    return Dataset(
+        emails=[user.email for user in users],
+        user_ids=[str(user.id) for user in users],
+        post_ids=[str(post.id) for post in posts],
+        tag_ids=[str(tag.id) for tag in tags],
+        tag_names=tag_names,
+        commented_post_ids=[str(post.id) for post in commented]
+    )
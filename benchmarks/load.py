@@ -0,0 +1,320 @@
+"""
+Load benchmark of every route of the user, post and tag blueprints on a synthetic dataset,
+driven through the Flask test client and directly at the WSGI level. Reports throughput
+and p50/p95/p99 latencies per endpoint as JSON, so runs can be compared between commits:
+
+    python -m benchmarks.load --requests 200 --output results.json
+    python -m benchmarks.load --host mongodb://localhost:27017 --posts 50000
+
+Without --host the dataset lives in an in-memory mongomock database, which measures the
+application overhead rather than the database; mongomock has no $text, so /post/search
+only succeeds against a real server. Mutating endpoints get their own targets
+(posts, tags or comments to delete, tags to remove), created before the timed requests.
+"""
+import json
+import platform
+import subprocess
+import sys
+from argparse import ArgumentParser
+from dataclasses import dataclass, field as dataclass_field
+from math import ceil
+from random import Random
+from time import perf_counter
+from werkzeug.test import EnvironBuilder
+from application import create_app
+from application.models.post import Post
+from application.models.text_post import TextPost
+from application.models.user import User
+from application.models.tag import Tag
+from application.models.post_comment import PostComment
+from application.shared.response_cache import response_cache
+from benchmarks.dataset import DatasetSize, Dataset, seed_dataset
+
+
+@dataclass
+class Request:
+    method: str
+    path: str
+    json: object = None
+
+
+@dataclass
+class Context:
+    dataset: Dataset
+    random: Random
+    # number of documents created so far, to keep generated emails and names unique
+    created: list = dataclass_field(default_factory=lambda: [0])
+
+    def unique(self) -> int:
+        self.created[0] += 1
+        return self.created[0]
+
+    def post_id(self) -> str:
+        return self.random.choice(self.dataset.post_ids)
+
+    def tag_id(self) -> str:
+        return self.random.choice(self.dataset.tag_ids)
+
+    def email(self) -> str:
+        return self.random.choice(self.dataset.emails)
+
+
+def post_body(context: Context, post_type: str) -> dict:
+    body = {'title': f'Benchmark post {context.unique()}', 'author': context.email()}
+    body.update({
+        'text': {'content': 'Lorem ipsum dolor sit amet.'},
+        'image': {'image_path': '/images/benchmark.jpg'},
+        'link': {'link_url': 'https://example.com/benchmark'}
+    }[post_type])
+    return body
+
+
+def disposable_post(context: Context) -> str:
+    return str(TextPost(
+        title=f'Disposable post {context.unique()}', content='Lorem ipsum',
+        author=User.objects(email=context.email()).first()
+    ).save().id)
+
+
+def disposable_tag(context: Context) -> str:
+    return str(Tag(name=f'disposable{context.unique()}').save().id)
+
+
+def disposable_comment(context: Context) -> tuple:
+    post_id = context.post_id()
+    comment = PostComment(post=post_id, content='Disposable comment', name='Benchmark').save()
+    Post.objects(id=post_id).update_one(inc__comment_count=1)
+    return post_id, str(comment.id)
+
+
+def tagged_post(context: Context) -> tuple:
+    post_id, tag_id = context.post_id(), context.tag_id()
+    tag = Tag.objects(id=tag_id).first()
+    if Post.objects(id=post_id, tags__ne=tag.name).update_one(add_to_set__tags=tag.name):
+        Tag.objects(id=tag_id).update_one(inc__post_count=1)
+    return post_id, tag_id
+
+
+def list_page(context: Context, path: str) -> Request:
+    query = context.random.choice(['', '?limit=50', '?fields=title,author', '?raw=true'])
+    return Request('GET', path + query)
+
+
+# endpoint -> function building one request, creating the documents it needs
+SCENARIOS = {
+    'POST /user/create': lambda context: Request('POST', '/user/create', {
+        'email': f'benchmark{context.unique()}@example.com', 'first_name': 'Bench', 'last_name': 'Mark'
+    }),
+    'POST /user/bulk_create': lambda context: Request('POST', '/user/bulk_create', [
+        {'email': f'benchmark{context.unique()}@example.com', 'first_name': 'Bench', 'last_name': 'Mark'}
+        for _ in range(100)
+    ]),
+    'GET /user/cache_stats': lambda context: Request('GET', '/user/cache_stats'),
+    'GET /user/<user_id>/posts': lambda context: Request(
+        'GET', f'/user/{context.random.choice(context.dataset.user_ids)}/posts'
+    ),
+    'GET /user/by_email/<email>/posts': lambda context: Request(
+        'GET', f'/user/by_email/{context.email()}/posts'
+    ),
+    'POST /post/create/text': lambda context: Request(
+        'POST', '/post/create/text', post_body(context, 'text')
+    ),
+    'POST /post/create/image': lambda context: Request(
+        'POST', '/post/create/image', post_body(context, 'image')
+    ),
+    'POST /post/create/link': lambda context: Request(
+        'POST', '/post/create/link', post_body(context, 'link')
+    ),
+    'POST /post/bulk_create': lambda context: Request('POST', '/post/bulk_create', [
+        {'post_type': post_type, **post_body(context, post_type)}
+        for post_type in ['text', 'image', 'link'] * 33
+    ]),
+    'GET /post/list': lambda context: list_page(context, '/post/list'),
+    'GET /post/list/<post_type>': lambda context: list_page(
+        context, '/post/list/' + context.random.choice(['text', 'image', 'link'])
+    ),
+    'GET /post/search': lambda context: Request(
+        'GET', '/post/search?q=' + context.random.choice(['post', 'lorem', 'example', 'post%201'])
+    ),
+    'PUT /post/update/<post_id>': lambda context: Request(
+        'PUT', f'/post/update/{context.post_id()}', {'title': f'Updated post {context.unique()}'}
+    ),
+    'DELETE /post/delete/<post_id>': lambda context: Request(
+        'DELETE', f'/post/delete/{disposable_post(context)}'
+    ),
+    'PUT /post/add_tag/<post_id>/<tag_id>': lambda context: Request(
+        'PUT', f'/post/add_tag/{context.post_id()}/{context.tag_id()}'
+    ),
+    'PUT /post/remove_tag/<post_id>/<tag_id>': lambda context: Request(
+        'PUT', '/post/remove_tag/%s/%s' % tagged_post(context)
+    ),
+    'POST /post/add_comment/<post_id>': lambda context: Request(
+        'POST', f'/post/add_comment/{context.post_id()}',
+        {'content': 'Benchmark comment', 'name': 'Benchmark'}
+    ),
+    'DELETE /post/remove_comment/<post_id>/<comment_id>': lambda context: Request(
+        'DELETE', '/post/remove_comment/%s/%s' % disposable_comment(context)
+    ),
+    'GET /post/<post_id>/comments': lambda context: Request(
+        'GET', f'/post/{context.random.choice(context.dataset.commented_post_ids)}/comments?limit=50'
+    ),
+    'POST /tag/create': lambda context: Request(
+        'POST', '/tag/create', {'name': f'benchmark{context.unique()}'}
+    ),
+    'POST /tag/bulk_create': lambda context: Request('POST', '/tag/bulk_create', [
+        {'name': f'benchmark{context.unique()}'} for _ in range(100)
+    ]),
+    'GET /tag/list': lambda context: Request(
+        'GET', context.random.choice(['/tag/list', '/tag/list?fields=name'])
+    ),
+    'PUT /tag/update/<tag_id>': lambda context: Request(
+        'PUT', f'/tag/update/{disposable_tag(context)}', {'name': f'renamed{context.unique()}'}
+    ),
+    'DELETE /tag/delete/<tag_id>': lambda context: Request(
+        'DELETE', f'/tag/delete/{disposable_tag(context)}'
+    )
+}
+
+
+def run_client(app, requests: list, cold: bool) -> tuple:
+    client = app.test_client()
+    timings, errors = [], 0
+    for request in requests:
+        if cold:
+            response_cache.clear()
+        start = perf_counter()
+        response = client.open(request.path, method=request.method, json=request.json)
+        response.get_data()
+        timings.append(perf_counter() - start)
+        errors += response.status_code >= 400
+    return timings, errors
+
+
+def run_wsgi(app, requests: list, cold: bool) -> tuple:
+    environs = [
+        EnvironBuilder(path=request.path, method=request.method, json=request.json).get_environ()
+        for request in requests
+    ]
+    statuses = []
+
+    def start_response(status, headers, exc_info=None):
+        statuses.append(int(status.split()[0]))
+
+    timings = []
+    for environ in environs:
+        if cold:
+            response_cache.clear()
+        start = perf_counter()
+        body = app(environ, start_response)
+        try:
+            for _ in body:
+                pass
+        finally:
+            if hasattr(body, 'close'):
+                body.close()
+        timings.append(perf_counter() - start)
+    return timings, sum(status >= 400 for status in statuses)
+
+
+def percentile(timings: list, percent: float) -> float:
+    ordered = sorted(timings)
+    return ordered[max(0, ceil(percent / 100 * len(ordered)) - 1)]
+
+
+def summarize(timings: list, errors: int) -> dict:
+    return {
+        'requests': len(timings),
+        'errors': errors,
+        'throughput_rps': round(len(timings) / sum(timings), 2),
+        'mean_ms': round(sum(timings) / len(timings) * 1000, 3),
+        'p50_ms': round(percentile(timings, 50) * 1000, 3),
+        'p95_ms': round(percentile(timings, 95) * 1000, 3),
+        'p99_ms': round(percentile(timings, 99) * 1000, 3)
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def mongodb_settings(host: str, db: str) -> dict:
+    if host:
+        return {'db': db, 'host': host, 'port': 27017}
+    try:
+        import mongomock
+    except ImportError:
+        sys.exit('mongomock is required without --host: pip install -r requirements-dev.txt')
+    return {
+        'db': db, 'host': 'mongodb://localhost', 'port': 27017,
+        'mongo_client_class': mongomock.MongoClient
+    }
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--host', help='MongoDB URI; an in-memory mongomock database when omitted')
+    parser.add_argument('--db', default='tumblelog_benchmark')
+    parser.add_argument('--users', type=int, default=DatasetSize.users)
+    parser.add_argument('--posts', type=int, default=DatasetSize.posts)
+    parser.add_argument('--tags', type=int, default=DatasetSize.tags)
+    parser.add_argument('--commented-posts', type=int, default=DatasetSize.commented_posts)
+    parser.add_argument('--comments-per-post', type=int, default=DatasetSize.comments_per_post)
+    parser.add_argument('--seed', type=int, default=DatasetSize.seed)
+    parser.add_argument('--requests', type=int, default=100, help='timed requests per endpoint and mode')
+    parser.add_argument('--warmup', type=int, default=5, help='untimed requests per endpoint and mode')
+    parser.add_argument('--mode', choices=['client', 'wsgi', 'both'], default='both')
+    parser.add_argument(
+        '--endpoint', action='append', help='only benchmark these endpoints, e.g. "GET /post/list"'
+    )
+    parser.add_argument(
+        '--cold', action='store_true', help='clear the response cache before every request'
+    )
+    parser.add_argument('--output', help='write the JSON results to this file instead of stdout')
+    args = parser.parse_args()
+
+    size = DatasetSize(
+        users=args.users, posts=args.posts, tags=args.tags, commented_posts=args.commented_posts,
+        comments_per_post=args.comments_per_post, seed=args.seed
+    )
+    app = create_app({'MONGODB_SETTINGS': mongodb_settings(args.host, args.db)})
+    dataset = seed_dataset(size)
+    context = Context(dataset, Random(args.seed))
+
+    modes = {'client': run_client, 'wsgi': run_wsgi}
+    if args.mode != 'both':
+        modes = {args.mode: modes[args.mode]}
+
+    results = {}
+    for mode, run in modes.items():
+        results[mode] = {}
+        for endpoint, build in SCENARIOS.items():
+            if args.endpoint and endpoint not in args.endpoint:
+                continue
+            run(app, [build(context) for _ in range(args.warmup)], args.cold)
+            requests = [build(context) for _ in range(args.requests)]
+            results[mode][endpoint] = summarize(*run(app, requests, args.cold))
+            print(f'{mode:>6} {endpoint}: {results[mode][endpoint]}', file=sys.stderr)
+
+    report = json.dumps({
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'backend': args.host or 'mongomock',
+        'dataset': vars(size),
+        'requests_per_endpoint': args.requests,
+        'cold': args.cold,
+        'results': results
+    }, indent=2)
+    if args.output:
+        with open(args.output, 'w') as output:
+            output.write(report + '\n')
+    else:
+        print(report)
+
+
+if __name__ == '__main__':
+    main()
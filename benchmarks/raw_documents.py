@@ -0,0 +1,87 @@
+"""
+Per-document cost of serializing posts through mongoengine documents (Post._from_son
+followed by to_dict, as the default list path does) against the raw BSON path used
+with ?raw=true (serialize_raw_post).
+
+Both paths start from the same BSON documents, so no database is needed:
+
+    python -m benchmarks.raw_documents --documents 10000
+"""
+from argparse import ArgumentParser
+from timeit import repeat
+from bson import ObjectId
+from application.models.user import User
+from application.models.post import Post
+# imported so that Post._from_son can resolve the _cls of every post type
+from application.models.text_post import TextPost  # noqa: F401
+from application.models.image_post import ImagePost  # noqa: F401
+from application.models.link_post import LinkPost  # noqa: F401
+from application.serializers.raw import serialize_raw_post, serialize_raw_user
+
+POST_TYPES = [
+    ('Post.TextPost', 'content', 'Lorem ipsum dolor sit amet, consectetur adipiscing elit.'),
+    ('Post.ImagePost', 'image_path', '/images/example.jpg'),
+    ('Post.LinkPost', 'link_url', 'https://example.com/some/article')
+]
+
+
+def make_author() -> dict:
+    return {'_id': ObjectId(), 'email': 'john.doe@example.com', 'first_name': 'John', 'last_name': 'Doe'}
+
+
+def make_posts(count: int, author: dict) -> list:
+    posts = []
+    for index in range(count):
+        cls, field, value = POST_TYPES[index % len(POST_TYPES)]
+        posts.append({
+            '_id': ObjectId(),
+            '_cls': cls,
+            'title': f'Example Post {index}',
+            'author': author['_id'],
+            'tags': ['python', 'mongodb', 'flask'],
+            'comments': [
+                {'id': ObjectId(), 'content': 'Example comment body', 'name': 'Example Commenter'}
+                for _ in range(3)
+            ],
+            'comment_count': 3,
+            field: value
+        })
+    return posts
+
+
+def document_path(posts: list, author: User) -> list:
+    documents = [Post._from_son(post) for post in posts]
+    for document in documents:
+        document._data['author'] = author  # as Post.prefetch_authors does
+    return [document.to_dict() for document in documents]
+
+
+def raw_path(posts: list, authors: dict) -> list:
+    return [serialize_raw_post(post, authors) for post in posts]
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--documents', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    author = make_author()
+    posts = make_posts(args.documents, author)
+    author_document = User._from_son(author)
+    authors = {author['_id']: serialize_raw_user(author)}
+
+    assert document_path(posts[:3], author_document) == raw_path(posts[:3], authors)
+
+    results = {}
+    for name, run in [
+        ('document', lambda: document_path(posts, author_document)),
+        ('raw', lambda: raw_path(posts, authors))
+    ]:
+        results[name] = min(repeat(run, number=1, repeat=args.repeat)) / args.documents * 1e6
+        print(f'{name:>10}: {results[name]:8.2f} us/document')
+    print(f'{"speedup":>10}: {results["document"] / results["raw"]:8.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""
+Cost of the compiled serializers behind to_dict() against the hand-written,
+attribute-by-attribute to_dict methods they replaced, on already loaded TextPost
+documents with their author and latest comments:
+
+    python -m benchmarks.serializers --documents 10000
+"""
+from argparse import ArgumentParser
+from timeit import repeat
+from bson import ObjectId
+from application.models.user import User
+from application.models.text_post import TextPost
+from application.models.comment import Comment
+
+
+def handwritten_to_dict(post: TextPost) -> dict:
+    return {
+        'id': str(post.id),  # convert ObjectId to string
+        'title': post.title,
+        'author': {
+            'id': str(post.author.id),
+            'email': post.author.email,
+            'first_name': post.author.first_name,
+            'last_name': post.author.last_name
+        } if post.author else None,
+        'tags': post.tags,
+        'comments': [
+            {'id': str(comment.id), 'content': comment.content, 'name': comment.name}
+            for comment in post.comments
+        ],
+        'comment_count': post.comment_count,
+        'content': post.content
+    }
+
+
+def make_posts(count: int) -> list:
+    author = User(id=ObjectId(), email='john.doe@example.com', first_name='John', last_name='Doe')
+    return [
+        TextPost(
+            id=ObjectId(),
+            title=f'Example Post {index}',
+            author=author,
+            tags=['python', 'mongodb', 'flask'],
+            comments=[
+                Comment(content='Example comment body', name='Example Commenter') for _ in range(3)
+            ],
+            comment_count=3,
+            content='Lorem ipsum dolor sit amet, consectetur adipiscing elit.'
+        )
+        for index in range(count)
+    ]
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--documents', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    posts = make_posts(args.documents)
+    assert [handwritten_to_dict(post) for post in posts[:3]] == [post.to_dict() for post in posts[:3]]
+
+    results = {}
+    for name, run in [
+        ('handwritten', lambda: [handwritten_to_dict(post) for post in posts]),
+        ('compiled', lambda: [post.to_dict() for post in posts])
+    ]:
+        results[name] = min(repeat(run, number=1, repeat=args.repeat)) / args.documents * 1e6
+        print(f'{name:>12}: {results[name]:8.2f} us/document')
+    print(f'{"speedup":>12}: {results["handwritten"] / results["compiled"]:8.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+import os
+import pytest
+from mongoengine import disconnect
+from mongoengine.connection import get_db
+from pymongo import MongoClient
+from pymongo.errors import ConnectionFailure
+from application import create_app
+from application.commands.index_commands import INDEXED_DOCUMENTS
+from application.config import mongodb_settings
+from application.models.collection_version import polled_versions
+from application.models.user import user_cache, author_page_cache
+from application.shared.response_cache import response_cache
+
+# The tests need a real MongoDB server, for explain() plans and command monitoring. They
+# run against the server of MONGODB_HOST/MONGODB_PORT in a database of their own, which
+# is dropped afterwards, and are skipped when no server answers.
+TEST_DB = os.environ.get('MONGODB_TEST_DB', 'tumblelog_test')
+
+
+@pytest.fixture(scope='session')
+def app():
+    settings = {**mongodb_settings(), 'db': TEST_DB}
+    client = MongoClient(settings['host'], settings['port'], serverSelectionTimeoutMS=1000)
+    try:
+        client.admin.command('ping')
+    except ConnectionFailure:
+        pytest.skip(f'no MongoDB server at {settings["host"]}:{settings["port"]}')
+    finally:
+        client.close()
+
+    app = create_app({'MONGODB_SETTINGS': settings, 'TESTING': True})
+    for document in INDEXED_DOCUMENTS:
+        document.ensure_indexes()
+    yield app
+    get_db().client.drop_database(TEST_DB)
+    disconnect()
+
+
+@pytest.fixture
+def client(app):
+    """
+    A test client on an empty database: the documents of the previous test are deleted,
+    the indexes are kept, and the in-process caches are cleared.
+    """
+    db = get_db()
+    for name in db.list_collection_names():
+        db[name].delete_many({})
+    for cache in (user_cache, author_page_cache, response_cache, polled_versions):
+        cache.clear()
+    return app.test_client()
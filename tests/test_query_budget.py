@@ -0,0 +1,31 @@
+import pytest
+from application.models.text_post import TextPost
+from application.models.user import User
+from application.shared.profiler import query_budget
+
+# A page of posts costs the CollectionVersion read of the response cache, the find on the
+# posts and one $in find on their authors, however many posts and authors it holds.
+LIST_QUERY_BUDGET = 3
+
+
+@pytest.fixture
+def posts(client):
+    authors = [
+        User(email=f'author{i}@example.com', first_name='Jane', last_name=f'Doe {i}').save()
+        for i in range(10)
+    ]
+    TextPost.objects.insert([
+        TextPost(title=f'Post {i}', content='Lorem ipsum', author=authors[i % len(authors)])
+        for i in range(50)
+    ], load_bulk=False)
+
+
+@pytest.mark.parametrize('path', [
+    '/post/list', '/post/list?raw=true', '/post/list/text', '/post/list?limit=100'
+])
+def test_post_list_query_budget(client, posts, path):
+    with query_budget(LIST_QUERY_BUDGET) as recorder:
+        response = client.get(path)
+    assert response.status_code == 200
+    assert response.get_json()['posts']
+    assert recorder.count > 0
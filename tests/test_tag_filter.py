@@ -0,0 +1,80 @@
+import pytest
+from flask import request
+from application.models.post import Post
+from application.models.text_post import TextPost
+from application.models.image_post import ImagePost
+from application.models.user import User
+from application.shared.constants import DEFAULT_PAGE_LIMIT
+from application.shared.post_types import POST_DOCUMENTS
+from application.views.post_views import list_queryset
+
+# the tags index of Post, named after its keys; mongoengine prepends _cls to it
+TAGS_INDEX = '_cls_1_tags_1__id_-1'
+
+
+def plan_stages(plan) -> list:
+    """
+    The (stage, index name) of every stage of an explain() plan, whatever its nesting.
+    """
+    stages = []
+    if isinstance(plan, dict):
+        if 'stage' in plan:
+            stages.append((plan['stage'], plan.get('indexName')))
+        for value in plan.values():
+            stages += plan_stages(value)
+    elif isinstance(plan, list):
+        for value in plan:
+            stages += plan_stages(value)
+    return stages
+
+
+@pytest.fixture
+def tagged_posts(client):
+    """
+    Posts of two types that all share a common tag, a few of them also carrying rarer
+    tags, so that a scan of every post is clearly worse than a seek on the tags.
+    """
+    author = User(email='author@example.com', first_name='Jane', last_name='Doe').save()
+    TextPost.objects.insert([
+        TextPost(
+            title=f'Text {i}', content='Lorem ipsum', author=author,
+            tags=['common'] + (['python', 'mongodb'] if i % 50 == 0 else [])
+        )
+        for i in range(500)
+    ], load_bulk=False)
+    ImagePost.objects.insert([
+        ImagePost(
+            title=f'Image {i}', image_path=f'/images/{i}.jpg', author=author,
+            tags=['common'] + (['python'] if i % 50 == 0 else [])
+        )
+        for i in range(200)
+    ], load_bulk=False)
+
+
+@pytest.mark.parametrize('post_type', [None, 'text'])
+@pytest.mark.parametrize('query', [
+    'tag=python', 'tag=python&tag=mongodb', 'tag=python&tag=mongodb&mode=any'
+])
+def test_tag_filter_uses_tags_index(app, tagged_posts, post_type, query):
+    path = f'/post/list/{post_type}' if post_type else '/post/list'
+    with app.test_request_context(f'{path}?{query}'):
+        queryset, _ = list_queryset(POST_DOCUMENTS[post_type] if post_type else Post, request.args)
+        # the query of the first page, as paginate() runs it
+        explain = queryset.order_by('-id').limit(DEFAULT_PAGE_LIMIT + 1).explain()
+
+    stages = plan_stages(explain['queryPlanner']['winningPlan'])
+    assert 'COLLSCAN' not in [stage for stage, _ in stages]
+    assert TAGS_INDEX in [index for _, index in stages]
+
+
+@pytest.mark.parametrize('path, expected', [
+    ('/post/list?tag=python', 14),
+    ('/post/list?tag=python&tag=mongodb', 10),
+    ('/post/list?tag=python&tag=mongodb&mode=any', 14),
+    ('/post/list/text?tag=python', 10),
+    ('/post/list/image?tag=python&tag=mongodb', 0)
+])
+def test_tag_filter_results(client, tagged_posts, path, expected):
+    response = client.get(f'{path}&limit=100')
+    assert response.status_code == 200
+    assert len(response.get_json()['posts']) == expected